@@ -0,0 +1,31 @@
+"""
+Debug helper for poking at the Voice Memos database from the terminal.
+
+Usage:
+    python scripts/debug_memo.py <function_name>
+
+Calls the named memo_data function with the detected Voice Memos db path,
+e.g. `python scripts/debug_memo.py list_unassigned_recording_details`.
+"""
+import sys
+from pprint import pprint
+
+from memo_transcriber import memo_data
+from memo_transcriber.voicememo_db import get_db_path
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+
+    func = getattr(memo_data, sys.argv[1], None)
+    if not callable(func):
+        print(f"❌ Unknown memo_data function: {sys.argv[1]}")
+        sys.exit(1)
+
+    pprint(func(str(get_db_path())))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,31 +3,63 @@ cli implementaion for package:
     exposes:
         get_db_path() via example()
 """
+import atexit
+import functools
+import io
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import click
-from .voicememo_db import cli_get_db_path
-from .memo_data import get_memo_data
-from .memo_organiser import MemoOrganiser
-from .database import MemoDatabase, get_user_data_dir
 from .model_config import TranscriptionModel, list_available_models, get_default_model
-from .voice_memos_printer import VoiceMemosPrinter
 from .cli_output import CliPrinter
 from .printer import Printer
 
-def _get_db():
-    """Get Voice Memos database path."""
-    db_path = cli_get_db_path()
-    if not db_path[0]:
-        print(f"{db_path[1]}")
-        sys.exit(1)
-    else:
-        return str(db_path[1])
+# The sqlite-backed modules are imported where they're used, --help and
+# list-models never load them
+if TYPE_CHECKING:
+    from .database import MemoDatabase
+
+# Static model config, resolved once at import
+_DEFAULT_MODEL = get_default_model()
+_AVAILABLE_MODELS = list_available_models()
+_VALID_MODELS = frozenset(m.value for m in TranscriptionModel)
 
+@functools.lru_cache(maxsize=1)
 def _get_default_transcription_db():
     """Get default transcription database path."""
+    from .database import get_user_data_dir
+
     return str(get_user_data_dir() / "memo_transcriptions.db")
 
+def _resolve_db_path(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> str:
+    """Click callback: fall back to the default transcription database."""
+    return value if value is not None else _get_default_transcription_db()
+
+# Shared --db-path option, resolved to a concrete path before the command runs
+_db_path_option = click.option('--db-path', default=None, callback=_resolve_db_path,
+                               help='Path to transcription database')
+
+# Enough transcript for the 100 char detail preview and the compact 5-word title
+_LIST_PREVIEW_CHARS = 200
+
+# MemoDatabase instances by path, reused across commands in this process
+_MEMO_DBS: Dict[str, "MemoDatabase"] = {}
+
+def _memo_db(db_path: str) -> "MemoDatabase":
+    """Get a MemoDatabase for db_path, reused across commands in this process."""
+    db = _MEMO_DBS.get(db_path)
+    if db is None:
+        from .database import MemoDatabase
+
+        db = _MEMO_DBS[db_path] = MemoDatabase(db_path)
+    return db
+
+@atexit.register
+def _close_memo_dbs() -> None:
+    """Close every cached MemoDatabase's connections on interpreter exit."""
+    for db in _MEMO_DBS.values():
+        db.close()
+    _MEMO_DBS.clear()
+
 @click.group()
 def main() -> None:
     pass
@@ -37,67 +69,91 @@ def list_models() -> None:
     """List all available transcription models."""
     from .model_config import MODEL_INFO
 
-    Printer.print_models_list(MODEL_INFO, get_default_model())
+    Printer.print_models_list(MODEL_INFO, _DEFAULT_MODEL)
 
 @main.command()
 def filetree() -> None:
     """Display memo file structure and organization."""
-    db_path = _get_db()
+    from .memo_data import get_memo_data
+    from .voice_memos_printer import VoiceMemosPrinter
+    from .voicememo_db import resolve_db_path
+
+    db_path = resolve_db_path()
     records = get_memo_data(db_path)
-    VoiceMemosPrinter.print_memo_files(records)
+    # Render the whole tree into memory, then hand it to the terminal in one write
+    buf = io.StringIO()
+    VoiceMemosPrinter.print_memo_files(records, out=buf)
+    sys.stdout.write(buf.getvalue())
 
 @main.command()
-@click.option('--db-path', default=None, help='Path to transcription database')
-def db_stats(db_path: Optional[str]) -> None:
+@_db_path_option
+def db_stats(db_path: str) -> None:
     """Show database statistics and processing history."""
-    if db_path is None:
-        db_path = _get_default_transcription_db()
-
     try:
-        db = MemoDatabase(db_path)
+        db = _memo_db(db_path)
         stats = db.get_processing_stats()
 
-        # Print header
-        Printer.print_db_stats_header(db_path)
-
-        # Print transcription statistics
-        Printer.print_transcription_stats(stats)
-
-        # Print export statistics
-        Printer.print_export_stats(stats)
-
-        # Print unexported count
-        unexported = db.get_unexported_transcriptions()
-        Printer.print_unexported_count(len(unexported))
+        # Header, transcription and export statistics, unexported count
+        Printer.print_db_stats(db_path, stats, stats['unexported'])
 
     except Exception as e:
         CliPrinter.error("Error reading database", e)
 
 @main.command()
-@click.option('--db-path', default=None, help='Path to transcription database')
+@_db_path_option
 @click.option('--status', help='Filter by status (success, failed, skipped)')
 @click.option('--limit', default=10, help='Maximum number of records to show, 0 = show all records')
 @click.option('--compact', is_flag=True, help='Show compact view with just title and status')
-def list_cached(db_path: Optional[str], status: Optional[str], limit: int, compact: bool) -> None:
+@click.option('--after', help='Only show records processed before this timestamp (from the next page hint)')
+@click.option('--after-uuid', default='', help='UUID of the last record shown, breaks timestamp ties with --after; '
+                   'on its own, pages through records with no timestamp')
+def list_cached(db_path: str, status: Optional[str], limit: int, compact: bool, after: Optional[str], after_uuid: str) -> None:
     """List cached transcriptions from database."""
-    if db_path is None:
-        db_path = _get_default_transcription_db()
-
     try:
-        db = MemoDatabase(db_path)
-        records = db.get_all_transcriptions(status_filter=status)
+        db = _memo_db(db_path)
+        if after is not None:
+            after_key = (after, after_uuid)
+        elif after_uuid:
+            # Cursor on an undated record, those come last ordered by uuid alone
+            after_key = (None, after_uuid)
+        else:
+            after_key = None
+
+        # Limit results 0 == show all
+        if limit == 0:
+            # The header needs the row count up front, so count before streaming
+            total = db.count_transcriptions(status_filter=status, after=after_key)
+            if not total:
+                Printer.print_no_transcriptions_found(status)
+                return
+
+            # Stream the list of cached transcriptions as rows come off the cursor
+            records = db.iter_transcriptions(status_filter=status, after=after_key,
+                                             preview_chars=_LIST_PREVIEW_CHARS)
+            Printer.print_cached_list(records, compact=compact, count=total)
+            return
 
+        # One extra row says whether another page follows
+        records = db.get_all_transcriptions(status_filter=status, limit=limit + 1, after=after_key,
+                                            preview_chars=_LIST_PREVIEW_CHARS)
         if not records:
             Printer.print_no_transcriptions_found(status)
             return
 
-        # Limit results 0 == show all
-        if len(records) > limit and limit != 0:
-            Printer.print_list_limit_message(limit, len(records))
-            records = records[:limit]
+        has_more = len(records) > limit
+        records = records[:limit]
+
+        # Only the first page reports the total, later pages stay O(page)
+        if has_more and after_key is None:
+            Printer.print_list_limit_message(limit, db.count_transcriptions(status_filter=status))
+
+        # A page is bounded by --limit, so buffer it and write it out once
+        buf = io.StringIO()
+        Printer.print_cached_list(records, compact=compact, out=buf)
+        sys.stdout.write(buf.getvalue())
 
-        # Print the list of cached transcriptions
-        Printer.print_cached_list(records, compact=compact)
+        if has_more:
+            Printer.print_next_page_hint(records[-1])
 
     except Exception as e:
         CliPrinter.error("Error reading database", e)
@@ -106,44 +162,45 @@ def list_cached(db_path: Optional[str], status: Optional[str], limit: int, compa
 @click.option('--transcribe/--no-transcribe', default=True, help='Whether to transcribe audio files')
 @click.option('--folder', help='Filter by specific folder')
 @click.option('--max-duration', default=8.0, help='Skip files longer than this many minutes')
-@click.option('--db-path', default=None, help='Path to transcription database')
+@_db_path_option
 @click.option('--model', default=None, help='Transcription model (apple, whisper-base, faster-whisper-base, etc.)')
-def organise(transcribe: bool, folder: Optional[str], max_duration: float, db_path: Optional[str], model: Optional[str]) -> None:
+@click.option('--workers', default=1, type=click.IntRange(min=1), help='Parallel transcriptions (faster-whisper models only)')
+def organise(transcribe: bool, folder: Optional[str], max_duration: float, db_path: str, model: Optional[str], workers: int) -> None:
     """Organise voice memos with transcriptions."""
-    voice_memos_db = _get_db()
-    memo_files = get_memo_data(voice_memos_db)
-
-    if db_path is None:
-        db_path = _get_default_transcription_db()
-
-    # Parse model selection
-    transcription_model = None
+    # Parse model selection, validated before touching either database
     if model:
-        try:
-            transcription_model = TranscriptionModel(model)
-        except ValueError:
-            Printer.print_invalid_model_error(model, list_available_models())
+        if model not in _VALID_MODELS:
+            Printer.print_invalid_model_error(model, _AVAILABLE_MODELS)
             sys.exit(1)
+        transcription_model = TranscriptionModel(model)
     else:
         # set in model_config.py
-        transcription_model = get_default_model()
+        transcription_model = _DEFAULT_MODEL
+
+    from .memo_data import get_memo_data
+    # Deferred: pulls in the transcription engines
+    from .memo_organiser import MemoOrganiser
+    from .voicememo_db import resolve_db_path
+
+    voice_memos_db = resolve_db_path()
+    # Folder filter runs in SQL so other folders are never transcribed
+    memo_files = get_memo_data(voice_memos_db, folder=folder)
 
     # Print header
     Printer.print_organise_header(voice_memos_db, db_path, transcription_model.value)
 
     organiser = MemoOrganiser(db_path=db_path)
-    organised = organiser.organise_memos(memo_files, transcribe=transcribe, max_duration_minutes=max_duration, model=transcription_model)
+    organised = organiser.iter_organise_memos(memo_files, transcribe=transcribe, max_duration_minutes=max_duration,
+                                              model=transcription_model, workers=workers)
 
-    # Filter by folder if specified
-    if folder:
-        organised = [memo for memo in organised if memo.folder == folder]
-
-    # Print results
-    for memo in organised:
-        Printer.print_organised_memo(memo)
-
-    # Print summary
-    summary = organiser.get_transcription_summary(organised)
+    # Print each result as it's organised; the summary keeps counts, not memos.
+    # Closing the stream on the way out lets the organiser close its progress
+    # bar and record the batch even if printing fails part way
+    printed = Printer.print_organised_memos_as_done(organised)
+    try:
+        summary = organiser.get_transcription_summary(printed)
+    finally:
+        printed.close()
     Printer.print_organise_summary(summary)
 
 @main.command()
@@ -152,11 +209,10 @@ def organise(transcribe: bool, folder: Optional[str], max_duration: float, db_pa
 @click.option('--all', 'export_all', is_flag=True, help='Export all transcriptions, not just unexported')
 @click.option('--force', is_flag=True, help='Overwrite existing files even if unchanged')
 @click.option('--status', default='success', help='Filter by status (success, failed, skipped)')
-@click.option('--db-path', default=None, help='Path to transcription database')
-def export(export_format: str, output_dir: str, export_all: bool, force: bool, status: str, db_path: Optional[str]) -> None:
+@_db_path_option
+def export(export_format: str, output_dir: str, export_all: bool, force: bool, status: str, db_path: str) -> None:
     """Export transcriptions to files on disk."""
-    if db_path is None:
-        db_path = _get_default_transcription_db()
+    from .memo_organiser import MemoOrganiser
 
     try:
         # Initialize organiser with output directory
@@ -2,12 +2,15 @@
 Consistent CLI output formatting utilities.
 Centralizes all print patterns for easier maintenance and testing.
 """
-from typing import Dict, Optional, Any
+import click
+from typing import Dict, List, Optional, Any, TextIO
 
 
 class OutputStyle:
     """Constants for output formatting."""
     SEPARATOR_WIDTH = 70
+    SEPARATOR = "=" * SEPARATOR_WIDTH
+    THIN_SEPARATOR = "-" * SEPARATOR_WIDTH
     INDENT = "   "
     DOUBLE_INDENT = "      "
 
@@ -29,40 +32,53 @@ class OutputStyle:
     SEARCH = "🔍"
 
 
+# Status name -> emoji, built once rather than per status() call
+_STATUS_EMOJI = {
+    'success': OutputStyle.SUCCESS,
+    'failed': OutputStyle.ERROR,
+    'error': OutputStyle.ERROR,
+    'skipped': OutputStyle.SKIP,
+}
+
+
 class CliPrinter:
     """Utility class for consistent CLI output formatting."""
 
+    @staticmethod
+    def format_header(title: str, emoji: str = "") -> str:
+        """Format a header line with optional emoji."""
+        prefix = f"{emoji} " if emoji else ""
+        return f"{prefix}{title}"
+
     @staticmethod
     def header(title: str, emoji: str = "") -> None:
         """Print a header line with optional emoji."""
-        prefix = f"{emoji} " if emoji else ""
-        print(f"{prefix}{title}")
+        click.echo(CliPrinter.format_header(title, emoji))
 
     @staticmethod
     def separator(char: str = "=", width: int = OutputStyle.SEPARATOR_WIDTH) -> None:
         """Print a separator line."""
-        print(char * width)
+        click.echo(char * width)
+
+    @staticmethod
+    def format_kv(key: str, value: Any, indent_level: int = 1) -> str:
+        """Format a key-value pair with indentation."""
+        indent = OutputStyle.INDENT * indent_level
+        return f"{indent}{key}: {value}"
 
     @staticmethod
     def kv(key: str, value: Any, indent_level: int = 1) -> None:
         """Print a key-value pair with indentation."""
-        indent = OutputStyle.INDENT * indent_level
-        print(f"{indent}{key}: {value}")
+        click.echo(CliPrinter.format_kv(key, value, indent_level))
 
     @staticmethod
     def status(status: str, message: str, use_emoji: bool = True) -> None:
         """Print a status message with appropriate emoji."""
         if use_emoji:
-            emoji_map = {
-                'success': OutputStyle.SUCCESS,
-                'failed': OutputStyle.ERROR,
-                'error': OutputStyle.ERROR,
-                'skipped': OutputStyle.SKIP,
-            }
-            emoji = emoji_map.get(status.lower(), OutputStyle.UNKNOWN)
-            print(f"{emoji} {status}: {message}")
+            emoji = _STATUS_EMOJI.get(status.lower(), OutputStyle.UNKNOWN)
+            click.echo(f"{emoji} {status}: {message}")
         else:
-            print(f"{status}: {message}")
+            click.echo(f"{status}: {message}")
 
     @staticmethod
     def error(message: str, exception: Optional[Exception] = None) -> None:
@@ -70,25 +86,26 @@ class CliPrinter:
         msg = f"{OutputStyle.ERROR} {message}"
         if exception:
             msg += f": {exception}"
-        print(msg)
+        click.echo(msg)
 
     @staticmethod
     def success(message: str) -> None:
         """Print a success message."""
-        print(f"{OutputStyle.SUCCESS} {message}")
+        click.echo(f"{OutputStyle.SUCCESS} {message}")
 
     @staticmethod
     def info(message: str, emoji: str = "") -> None:
         """Print an informational message with optional emoji."""
         prefix = f"{emoji} " if emoji else ""
-        print(f"{prefix}{message}")
+        click.echo(f"{prefix}{message}")
 
     @staticmethod
     def summary(stats: Dict[str, Any], title: str = "Summary", emoji: str = OutputStyle.STATS) -> None:
         """Print a summary section with stats."""
-        print(f"\n{emoji} {title}:")
-        for key, value in stats.items():
-            CliPrinter.kv(key.replace('_', ' ').capitalize(), value)
+        lines = [f"\n{emoji} {title}:"]
+        lines.extend(CliPrinter.format_kv(key.replace('_', ' ').capitalize(), value)
+                     for key, value in stats.items())
+        CliPrinter.write_lines(lines)
 
     @staticmethod
     def section_start(title: str, emoji: str = "", width: int = OutputStyle.SEPARATOR_WIDTH) -> None:
@@ -99,10 +116,16 @@ class CliPrinter:
     @staticmethod
     def section_end(width: int = OutputStyle.SEPARATOR_WIDTH) -> None:
         """End a section with separator."""
-        print()
+        click.echo()
         CliPrinter.separator("=", width)
 
+    @staticmethod
+    def write_lines(lines: List[str], out: Optional[TextIO] = None) -> None:
+        """Write pre-formatted lines to out (default stdout) in a single call."""
+        if lines:
+            click.echo("\n".join(lines), file=out)
+
     @staticmethod
     def blank_line() -> None:
         """Print a blank line for spacing."""
-        print()
+        click.echo()
@@ -8,22 +8,19 @@ import time
 from typing import Optional, List
 import click
 from pathlib import Path
-from .database import MemoDatabase, ModelTranscriptionRecord, ComparisonRecord
-from .voicememo_db import cli_get_db_path, cli_get_rec_path
-from .memo_data import get_memo_data
-from .transcriber import transcribe_file
 from .model_config import TranscriptionModel, list_available_models
-from .comparison import compare_transcriptions
+from .cli_output import OutputStyle
+from .printer import STATUS_EMOJI_MAP
 
+# The sqlite-backed and scoring modules are imported in the commands that
+# use them, --help never loads them
 
-def _get_db():
-    """Get Voice Memos database path."""
-    db_path = cli_get_db_path()
-    if not db_path[0]:
-        print(f"{db_path[1]}")
-        sys.exit(1)
-    else:
-        return str(db_path[1])
+# Model names in display order for the error message, and as a set for lookups
+_MODEL_NAMES = tuple(name for name, _ in list_available_models())
+_AVAILABLE_MODELS = frozenset(_MODEL_NAMES)
+
+# Medals for the top three in show-results
+_RANK_EMOJI = ("🏆", "🥈", "🥉")
 
 
 @click.group()
@@ -41,55 +38,56 @@ def transcribe_models(memo_uuid: str, models: str) -> None:
     model_list = [m.strip() for m in models.split(',')]
 
     # Validate models
-    available = [m[0] for m in list_available_models()]
     for model_name in model_list:
-        if model_name not in available:
-            print(f"❌ Invalid model: {model_name}")
-            print(f"\nAvailable models: {', '.join(available)}")
+        if model_name not in _AVAILABLE_MODELS:
+            click.echo(f"❌ Invalid model: {model_name}")
+            click.echo(f"\nAvailable models: {', '.join(_MODEL_NAMES)}")
             sys.exit(1)
 
-    # Get memo data from Voice Memos database
-    voice_db_path = _get_db()
-    memo_files = get_memo_data(voice_db_path)
+    from .database import MemoDatabase, ModelTranscriptionRecord
+    from .memo_data import get_memo_by_uuid
+    from .voicememo_db import cli_get_rec_path, resolve_db_path
+    # Deferred: pulls in the transcription engines
+    from .transcriber import transcribe_file
 
-    # Find the memo
-    memo = None
-    for m in memo_files:
-        if m.uuid == memo_uuid:
-            memo = m
-            break
+    # Get memo data from Voice Memos database
+    voice_db_path = resolve_db_path()
+    memo = get_memo_by_uuid(voice_db_path, memo_uuid)
 
     if not memo:
-        print(f"❌ Memo not found: {memo_uuid}")
+        click.echo(f"❌ Memo not found: {memo_uuid}")
         sys.exit(1)
 
-    print(f"📝 {memo.plain_title}")
-    print(f"   UUID: {memo_uuid}")
-    print(f"   Duration: {memo.duration_seconds:.1f}s")
-    print(f"   Models: {', '.join(model_list)}")
-    print("=" * 70)
+    click.echo(f"📝 {memo.plain_title}\n"
+               f"   UUID: {memo_uuid}\n"
+               f"   Duration: {memo.duration_seconds:.1f}s\n"
+               f"   Models: {', '.join(model_list)}\n"
+               + OutputStyle.SEPARATOR)
 
     # Get recordings path
     recordings_path = cli_get_rec_path()
     audio_file = recordings_path / memo.file_path
 
     if not audio_file.exists():
-        print(f"❌ Audio file not found: {audio_file}")
+        click.echo(f"❌ Audio file not found: {audio_file}")
         sys.exit(1)
 
     # Initialize database
     db = MemoDatabase()
-    file_hash = db.get_file_hash(str(audio_file))
+    file_hash = db.get_or_compute_file_hash(str(audio_file))
+
+    # Existing transcriptions for every model in one query, not one per model
+    existing_by_model = {t.model_used: t for t in db.get_model_transcriptions_for_memo(memo_uuid)}
 
     # Transcribe with each model
     for model_name in model_list:
         # Check if already transcribed
-        existing = db.get_model_transcription_by_model(memo_uuid, model_name)
+        existing = existing_by_model.get(model_name)
         if existing and existing.file_hash == file_hash:
-            print(f"\n⏭️  {model_name}: Already transcribed (skipping)")
+            click.echo(f"\n⏭️  {model_name}: Already transcribed (skipping)")
             continue
 
-        print(f"\n🤖 Transcribing with {model_name}...")
+        click.echo(f"\n🤖 Transcribing with {model_name}...")
         model = TranscriptionModel(model_name)
 
         start_time = time.time()
@@ -114,9 +112,9 @@ def transcribe_models(memo_uuid: str, models: str) -> None:
 
             trans_id = db.save_model_transcription(record)
 
-            print(f"   ✅ Success (ID: {trans_id})")
-            print(f"   Time: {processing_time:.2f}s")
-            print(f"   Preview: {transcription[:80]}...")
+            click.echo(f"   ✅ Success (ID: {trans_id})")
+            click.echo(f"   Time: {processing_time:.2f}s")
+            click.echo(f"   Preview: {transcription[:80]}...")
 
         except Exception as e:
             processing_time = time.time() - start_time
@@ -139,45 +137,55 @@ def transcribe_models(memo_uuid: str, models: str) -> None:
 
             db.save_model_transcription(record)
 
-            print(f"   ❌ Failed: {e}")
+            click.echo(f"   ❌ Failed: {e}")
 
-    print("\n" + "=" * 70)
-    print("✅ Transcription complete")
+    click.echo("\n" + OutputStyle.SEPARATOR)
+    click.echo("✅ Transcription complete")
 
 
 @main.command()
 @click.argument('memo_uuid')
 def list_transcriptions(memo_uuid: str) -> None:
     """List all model transcriptions for a memo."""
+    from .database import MemoDatabase
+
     db = MemoDatabase()
     transcriptions = db.get_model_transcriptions_for_memo(memo_uuid)
 
     if not transcriptions:
-        print(f"No transcriptions found for memo: {memo_uuid}")
-        print("\nTo transcribe:")
-        print(f"  comparator transcribe-models {memo_uuid} --models whisper-base,faster-whisper-base")
+        click.echo(f"No transcriptions found for memo: {memo_uuid}")
+        click.echo("\nTo transcribe:")
+        click.echo(f"  comparator transcribe-models {memo_uuid} --models whisper-base,faster-whisper-base")
         return
 
-    print(f"Transcriptions for memo: {memo_uuid}")
-    print("=" * 70)
+    click.echo(f"Transcriptions for memo: {memo_uuid}")
+    click.echo(OutputStyle.SEPARATOR)
 
     for trans in transcriptions:
         ref_marker = " 📌 REFERENCE" if trans.is_reference else ""
-        status_emoji = "✅" if trans.status == "success" else "❌"
+        status_emoji = STATUS_EMOJI_MAP.get(trans.status, OutputStyle.ERROR)
 
-        print(f"\n{status_emoji} {trans.model_used}{ref_marker}")
-        print(f"   ID: {trans.id}")
-        print(f"   Status: {trans.status}")
+        # One write per transcription
+        lines = [
+            f"\n{status_emoji} {trans.model_used}{ref_marker}",
+            f"   ID: {trans.id}",
+            f"   Status: {trans.status}",
+        ]
 
         if trans.processing_time_seconds:
-            print(f"   Processing time: {trans.processing_time_seconds:.2f}s")
+            lines.append(f"   Processing time: {trans.processing_time_seconds:.2f}s")
 
         if trans.status == 'success':
-            word_count = len(trans.transcription.split())
-            print(f"   Word count: {word_count}")
-            print(f"   Preview: {trans.transcription[:80]}...")
+            # Stored on save; rows written before the column existed have NULL
+            word_count = trans.word_count
+            if word_count is None:
+                word_count = len(trans.transcription.split())
+            lines.append(f"   Word count: {word_count}")
+            lines.append(f"   Preview: {trans.transcription[:80]}...")
         elif trans.error_message:
-            print(f"   Error: {trans.error_message}")
+            lines.append(f"   Error: {trans.error_message}")
+
+        click.echo("\n".join(lines))
 
 
 @main.command()
@@ -186,44 +194,43 @@ def list_transcriptions(memo_uuid: str) -> None:
 @click.option('--id', 'trans_id', type=int, help='Mark existing transcription as reference by ID')
 def set_reference(memo_uuid: str, text: Optional[str], trans_id: Optional[int]) -> None:
     """Set reference (ground truth) transcription for a memo."""
+    from .database import MemoDatabase, ModelTranscriptionRecord
+    from .memo_data import get_memo_by_uuid
+    from .voicememo_db import resolve_db_path
+
     db = MemoDatabase()
 
     if text and trans_id:
-        print("❌ Error: Specify either --text or --id, not both")
+        click.echo("❌ Error: Specify either --text or --id, not both")
         sys.exit(1)
 
     if not text and not trans_id:
-        print("❌ Error: Must specify either --text or --id")
+        click.echo("❌ Error: Must specify either --text or --id")
         sys.exit(1)
 
     if trans_id:
         # Mark existing transcription as reference
         trans = db.get_model_transcription(trans_id)
         if not trans:
-            print(f"❌ Transcription not found: ID {trans_id}")
+            click.echo(f"❌ Transcription not found: ID {trans_id}")
             sys.exit(1)
 
         if trans.memo_uuid != memo_uuid:
-            print(f"❌ Transcription ID {trans_id} does not belong to memo {memo_uuid}")
+            click.echo(f"❌ Transcription ID {trans_id} does not belong to memo {memo_uuid}")
             sys.exit(1)
 
         db.mark_model_transcription_as_reference(trans_id)
-        print(f"✅ Marked as reference: {trans.model_used} (ID: {trans_id})")
-        print(f"   {trans.transcription[:100]}...")
+        click.echo(f"✅ Marked as reference: {trans.model_used} (ID: {trans_id})")
+        click.echo(f"   {trans.transcription[:100]}...")
 
     elif text:
         # Create new reference transcription
         # Get memo info
-        voice_db_path = _get_db()
-        memo_files = get_memo_data(voice_db_path)
-        memo = None
-        for m in memo_files:
-            if m.uuid == memo_uuid:
-                memo = m
-                break
+        voice_db_path = resolve_db_path()
+        memo = get_memo_by_uuid(voice_db_path, memo_uuid)
 
         if not memo:
-            print(f"❌ Memo not found: {memo_uuid}")
+            click.echo(f"❌ Memo not found: {memo_uuid}")
             sys.exit(1)
 
         # Unmark any existing reference
@@ -231,6 +238,9 @@ def set_reference(memo_uuid: str, text: Optional[str], trans_id: Optional[int])
         if existing_ref:
             db.mark_model_transcription_as_reference(0)  # Unmark
 
+        # Counted once, stored with the row and echoed below
+        word_count = len(text.split())
+
         # Create new reference record
         record = ModelTranscriptionRecord(
             memo_uuid=memo_uuid,
@@ -242,119 +252,144 @@ def set_reference(memo_uuid: str, text: Optional[str], trans_id: Optional[int])
             folder_name=memo.folder,
             file_path=memo.file_path,
             duration_seconds=memo.duration_seconds,
-            recording_date=memo.recording_date
+            recording_date=memo.recording_date,
+            word_count=word_count
         )
 
         trans_id = db.save_model_transcription(record)
-        print(f"✅ Reference transcription created (ID: {trans_id})")
-        print(f"   Word count: {len(text.split())}")
-        print(f"   Preview: {text[:100]}...")
+        click.echo(f"✅ Reference transcription created (ID: {trans_id})")
+        click.echo(f"   Word count: {word_count}")
+        click.echo(f"   Preview: {text[:100]}...")
 
 
 @main.command()
 @click.argument('memo_uuid')
 def compare_all(memo_uuid: str) -> None:
     """Compare all model transcriptions against the reference."""
+    from .comparison import compare_transcriptions_batch
+    from .database import MemoDatabase, ComparisonRecord
+
     db = MemoDatabase()
 
-    # Get reference
-    reference = db.get_reference_for_memo(memo_uuid)
+    # One query for every transcription of the memo, the reference among them
+    transcriptions = db.get_model_transcriptions_for_memo(memo_uuid)
+    reference = next((t for t in transcriptions if t.is_reference), None)
     if not reference:
-        print(f"❌ No reference transcription set for memo: {memo_uuid}")
-        print("\nTo set reference:")
-        print(f"  comparator set-reference {memo_uuid} --text \"correct transcription\"")
-        print(f"  comparator set-reference {memo_uuid} --id <transcription-id>")
+        click.echo(f"❌ No reference transcription set for memo: {memo_uuid}")
+        click.echo("\nTo set reference:")
+        click.echo(f"  comparator set-reference {memo_uuid} --text \"correct transcription\"")
+        click.echo(f"  comparator set-reference {memo_uuid} --id <transcription-id>")
         return
 
-    # Get all transcriptions
-    transcriptions = db.get_model_transcriptions_for_memo(memo_uuid)
-
     # Filter out reference
     hypotheses = [t for t in transcriptions if t.id != reference.id]
 
     if not hypotheses:
-        print(f"No model transcriptions to compare for memo: {memo_uuid}")
-        print("\nTo transcribe:")
-        print(f"  comparator transcribe-models {memo_uuid} --models whisper-base,faster-whisper-base")
+        click.echo(f"No model transcriptions to compare for memo: {memo_uuid}")
+        click.echo("\nTo transcribe:")
+        click.echo(f"  comparator transcribe-models {memo_uuid} --models whisper-base,faster-whisper-base")
         return
 
-    print(f"📊 Comparing against reference: {reference.model_used}")
-    print(f"   ID: {reference.id}")
-    print(f"   Words: {len(reference.transcription.split())}")
-    print("=" * 70)
+    click.echo(f"📊 Comparing against reference: {reference.model_used}")
+    click.echo(f"   ID: {reference.id}")
+    ref_words = reference.word_count
+    if ref_words is None:
+        ref_words = len(reference.transcription.split())
+    click.echo(f"   Words: {ref_words}")
+    click.echo(OutputStyle.SEPARATOR)
+
+    # Pairs scored on an earlier run; transcriptions are replaced under a new
+    # id rather than edited, so a stored (reference, hypothesis) result holds
+    cached = db.get_model_comparisons_for_reference(reference.id)
+
+    # Every pair without a stored result is scored in one batch
+    pending = [hyp for hyp in hypotheses
+               if hyp.status == 'success' and hyp.id not in cached]
+    fresh = dict(zip(
+        (hyp.id for hyp in pending),
+        compare_transcriptions_batch(reference.transcription,
+                                     [hyp.transcription for hyp in pending])
+    ))
 
     # Compare each hypothesis
+    comparisons = []
     for hyp in hypotheses:
         if hyp.status != 'success':
-            print(f"\n⏭️  {hyp.model_used}: Skipped (status: {hyp.status})")
+            click.echo(f"\n⏭️  {hyp.model_used}: Skipped (status: {hyp.status})")
             continue
 
-        print(f"\n🤖 {hyp.model_used} (ID: {hyp.id})")
-
-        # Run comparison
-        results = compare_transcriptions(
-            reference.transcription,
-            hyp.transcription,
-            normalize=True
-        )
+        comparison = cached.get(hyp.id)
+        if comparison is not None:
+            marker = " ⚡ cached"
+        else:
+            marker = ""
+            results = fresh[hyp.id]
+
+            # Collected and saved together after the loop
+            comparison = ComparisonRecord(
+                reference_id=reference.id,
+                hypothesis_id=hyp.id,
+                wer=results['wer'],
+                cer=results['cer'],
+                substitutions=results['substitutions'],
+                deletions=results['deletions'],
+                insertions=results['insertions'],
+                total_edits=results['total_edits'],
+                word_count_ref=results['word_count_ref'],
+                word_count_hyp=results['word_count_hyp'],
+                word_count_diff=results['word_count_diff'],
+                word_count_diff_pct=results['word_count_diff_pct'],
+                jaccard_similarity=results['jaccard_similarity'],
+                cosine_similarity=results['cosine_similarity']
+            )
+            comparisons.append(comparison)
 
-        # Display results
-        print(f"   WER: {results['wer']:.2%}")
-        print(f"   CER: {results['cer']:.2%}")
-        print(f"   Edits: {results['total_edits']} (S:{results['substitutions']} D:{results['deletions']} I:{results['insertions']})")
-        print(f"   Words: {results['word_count_hyp']} ({results['word_count_diff']:+d})")
-        print(f"   Jaccard: {results['jaccard_similarity']:.2%}")
-        print(f"   Cosine: {results['cosine_similarity']:.2%}")
-
-        # Save to database
-        comparison = ComparisonRecord(
-            reference_id=reference.id,
-            hypothesis_id=hyp.id,
-            wer=results['wer'],
-            cer=results['cer'],
-            substitutions=results['substitutions'],
-            deletions=results['deletions'],
-            insertions=results['insertions'],
-            total_edits=results['total_edits'],
-            word_count_ref=results['word_count_ref'],
-            word_count_hyp=results['word_count_hyp'],
-            word_count_diff=results['word_count_diff'],
-            word_count_diff_pct=results['word_count_diff_pct'],
-            jaccard_similarity=results['jaccard_similarity'],
-            cosine_similarity=results['cosine_similarity']
-        )
+        # Display results, one write per model
+        click.echo("\n".join((
+            f"\n🤖 {hyp.model_used} (ID: {hyp.id}){marker}",
+            f"   WER: {comparison.wer:.2%}",
+            f"   CER: {comparison.cer:.2%}",
+            f"   Edits: {comparison.total_edits} (S:{comparison.substitutions} D:{comparison.deletions} I:{comparison.insertions})",
+            f"   Words: {comparison.word_count_hyp} ({comparison.word_count_diff:+d})",
+            f"   Jaccard: {comparison.jaccard_similarity:.2%}",
+            f"   Cosine: {comparison.cosine_similarity:.2%}",
+        )))
 
-        db.save_model_comparison(comparison)
+    if comparisons:
+        db.save_model_comparisons(comparisons)
 
-    print("\n" + "=" * 70)
-    print("✅ Comparison complete")
+    click.echo("\n" + OutputStyle.SEPARATOR)
+    click.echo("✅ Comparison complete")
 
 
 @main.command()
 @click.argument('memo_uuid')
 def show_results(memo_uuid: str) -> None:
     """Show comparison results for a memo."""
+    from .database import MemoDatabase
+
     db = MemoDatabase()
 
-    # Get reference
-    reference = db.get_reference_for_memo(memo_uuid)
+    # One query for every transcription of the memo, the reference among them
+    transcriptions = db.get_model_transcriptions_for_memo(memo_uuid)
+    reference = next((t for t in transcriptions if t.is_reference), None)
     if not reference:
-        print(f"❌ No reference transcription set for memo: {memo_uuid}")
+        click.echo(f"❌ No reference transcription set for memo: {memo_uuid}")
         return
 
-    # Get comparisons
-    comparisons = db.get_comparisons_for_memo(memo_uuid)
+    # Get comparisons, best WER first (lower is better)
+    comparisons = db.get_comparisons_for_memo(memo_uuid, order_by='wer')
 
     if not comparisons:
-        print(f"No comparisons found for memo: {memo_uuid}")
-        print("\nRun comparisons first:")
-        print(f"  comparator compare-all {memo_uuid}")
+        click.echo(f"No comparisons found for memo: {memo_uuid}")
+        click.echo("\nRun comparisons first:")
+        click.echo(f"  comparator compare-all {memo_uuid}")
         return
 
-    print(f"📊 Comparison Results")
-    print(f"   Memo: {memo_uuid}")
-    print(f"   Reference: {reference.model_used} (ID: {reference.id})")
-    print("=" * 70)
+    click.echo(f"📊 Comparison Results")
+    click.echo(f"   Memo: {memo_uuid}")
+    click.echo(f"   Reference: {reference.model_used} (ID: {reference.id})")
+    click.echo(OutputStyle.SEPARATOR)
 
     # Collect results
     results = []
@@ -367,24 +402,27 @@ def show_results(memo_uuid: str) -> None:
             'cosine': comp.cosine_similarity
         })
 
-    # Sort by WER (lower is better)
-    results.sort(key=lambda x: x['wer'])
-
-    print("\nModel Performance (sorted by WER):")
-    print("-" * 70)
+    click.echo("\nModel Performance (sorted by WER):")
+    click.echo(OutputStyle.THIN_SEPARATOR)
 
+    # Whole ranking built up and written in one call
+    lines = []
     for i, r in enumerate(results):
-        rank_emoji = "🏆" if i == 0 else "🥈" if i == 1 else "🥉" if i == 2 else "  "
-        print(f"\n{rank_emoji} {r['model']}")
-        print(f"   WER: {r['wer']:.2%}")
-        print(f"   CER: {r['cer']:.2%}")
-        print(f"   Jaccard: {r['jaccard']:.2%}")
-        print(f"   Cosine: {r['cosine']:.2%}")
+        rank_emoji = _RANK_EMOJI[i] if i < len(_RANK_EMOJI) else "  "
+        lines.extend((
+            f"\n{rank_emoji} {r['model']}",
+            f"   WER: {r['wer']:.2%}",
+            f"   CER: {r['cer']:.2%}",
+            f"   Jaccard: {r['jaccard']:.2%}",
+            f"   Cosine: {r['cosine']:.2%}",
+        ))
+    if lines:
+        click.echo("\n".join(lines))
 
     if results:
         best = results[0]
-        print("\n" + "=" * 70)
-        print(f"🏆 Best model: {best['model']} (WER: {best['wer']:.2%})")
+        click.echo("\n" + OutputStyle.SEPARATOR)
+        click.echo(f"🏆 Best model: {best['model']} (WER: {best['wer']:.2%})")
 
 
 if __name__ == '__main__':
@@ -5,6 +5,15 @@ from typing import Dict, List, Tuple
 import re
 import math
 
+try:
+    from rapidfuzz.distance import Levenshtein
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Anything that isn't a word character or whitespace, compiled once
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
 
 def normalize_text(text: str, remove_punctuation: bool = True) -> str:
     """
@@ -22,7 +31,7 @@ def normalize_text(text: str, remove_punctuation: bool = True) -> str:
 
     # Remove punctuation if requested
     if remove_punctuation:
-        text = re.sub(r'[^\w\s]', '', text)
+        text = _PUNCT_RE.sub('', text)
 
     # Normalize whitespace
     text = ' '.join(text.split())
@@ -30,45 +39,41 @@ def normalize_text(text: str, remove_punctuation: bool = True) -> str:
     return text
 
 
-def calculate_wer(reference: str, hypothesis: str) -> Dict[str, float]:
-    """
-    Calculate Word Error Rate (WER) using Levenshtein distance.
+# Backpointer codes stored per cell by _word_edits
+_OP_MATCH, _OP_SUB, _OP_DEL, _OP_INS = 0, 1, 2, 3
 
-    WER = (S + D + I) / N
-    where S=substitutions, D=deletions, I=insertions, N=reference word count
 
-    Args:
-        reference: Ground truth transcription
-        hypothesis: Transcription to evaluate
+def _word_edits(ref_words: List[str], hyp_words: List[str]) -> Tuple[int, int, int]:
+    """(substitutions, deletions, insertions) between two word lists, pure Python.
 
-    Returns:
-        Dict with wer, substitutions, deletions, insertions
+    Only two rows of distances are kept, the operation chosen for each cell
+    goes into a bytearray (one byte per cell) that the backtrack walks.
     """
-    ref_words = reference.split()
-    hyp_words = hypothesis.split()
-
-    # Build edit distance matrix
-    d = [[0] * (len(hyp_words) + 1) for _ in range(len(ref_words) + 1)]
-
-    # Initialize first row and column
-    for i in range(len(ref_words) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_words) + 1):
-        d[0][j] = j
-
-    # Fill matrix
-    for i in range(1, len(ref_words) + 1):
-        for j in range(1, len(hyp_words) + 1):
-            if ref_words[i-1] == hyp_words[j-1]:
-                d[i][j] = d[i-1][j-1]
+    n, m = len(ref_words), len(hyp_words)
+    ops = bytearray(n * m)  # _OP_MATCH everywhere until set
+    prev = list(range(m + 1))
+    curr = [0] * (m + 1)
+
+    # Fill rows; ties prefer deletion, then insertion, then substitution
+    for i in range(1, n + 1):
+        curr[0] = i
+        ref_word = ref_words[i-1]
+        row = (i - 1) * m
+        for j in range(1, m + 1):
+            if ref_word == hyp_words[j-1]:
+                curr[j] = prev[j-1]
+                continue
+            deletion, insertion, substitution = prev[j], curr[j-1], prev[j-1]
+            if deletion <= insertion and deletion <= substitution:
+                curr[j], ops[row + j - 1] = deletion + 1, _OP_DEL
+            elif insertion <= substitution:
+                curr[j], ops[row + j - 1] = insertion + 1, _OP_INS
             else:
-                substitution = d[i-1][j-1] + 1
-                insertion = d[i][j-1] + 1
-                deletion = d[i-1][j] + 1
-                d[i][j] = min(substitution, insertion, deletion)
+                curr[j], ops[row + j - 1] = substitution + 1, _OP_SUB
+        prev, curr = curr, prev
 
     # Backtrack to count operation types
-    i, j = len(ref_words), len(hyp_words)
+    i, j = n, m
     substitutions = deletions = insertions = 0
 
     while i > 0 or j > 0:
@@ -78,32 +83,61 @@ def calculate_wer(reference: str, hypothesis: str) -> Dict[str, float]:
         elif j == 0:
             deletions += 1
             i -= 1
-        elif ref_words[i-1] == hyp_words[j-1]:
-            i -= 1
-            j -= 1
         else:
-            # Find which operation was used
-            options = []
-            if i > 0 and j > 0:
-                options.append((d[i-1][j-1], 'sub', i-1, j-1))
-            if i > 0:
-                options.append((d[i-1][j], 'del', i-1, j))
-            if j > 0:
-                options.append((d[i][j-1], 'ins', i, j-1))
-
-            _, op, new_i, new_j = min(options)
-
-            if op == 'sub':
+            op = ops[(i - 1) * m + j - 1]
+            if op == _OP_MATCH:
+                i -= 1
+                j -= 1
+            elif op == _OP_SUB:
                 substitutions += 1
-            elif op == 'del':
+                i -= 1
+                j -= 1
+            elif op == _OP_DEL:
                 deletions += 1
+                i -= 1
             else:
                 insertions += 1
+                j -= 1
 
-            i, j = new_i, new_j
+    return substitutions, deletions, insertions
 
-    # Calculate WER
+
+def calculate_wer(reference: str, hypothesis: str) -> Dict[str, float]:
+    """
+    Calculate Word Error Rate (WER) using Levenshtein distance.
+
+    WER = (S + D + I) / N
+    where S=substitutions, D=deletions, I=insertions, N=reference word count
+
+    Args:
+        reference: Ground truth transcription
+        hypothesis: Transcription to evaluate
+
+    Returns:
+        Dict with wer, substitutions, deletions, insertions
+    """
+    ref_words = reference.split()
+    hyp_words = hypothesis.split()
     n = len(ref_words)
+
+    # Identical or one-sided inputs have a known answer, skip the matrix
+    if ref_words == hyp_words or not ref_words or not hyp_words:
+        deletions = n if not hyp_words else 0
+        insertions = len(hyp_words) if not ref_words else 0
+        return {
+            'wer': (deletions + insertions) / n if n > 0 else 0.0,
+            'substitutions': 0,
+            'deletions': deletions,
+            'insertions': insertions,
+            'total_edits': deletions + insertions,
+            'reference_words': n
+        }
+
+    # Always the pure-Python DP: the S/D/I split is stored with each comparison,
+    # and RapidFuzz's editops can break ties differently for the same total
+    substitutions, deletions, insertions = _word_edits(ref_words, hyp_words)
+
+    # Calculate WER
     wer = (substitutions + deletions + insertions) / n if n > 0 else 0.0
 
     return {
@@ -127,28 +161,32 @@ def calculate_cer(reference: str, hypothesis: str) -> float:
     Returns:
         Character error rate (0.0 to 1.0+)
     """
-    # Simple Levenshtein distance at character level
-    ref_chars = list(reference)
-    hyp_chars = list(hypothesis)
+    n = len(reference)
 
-    d = [[0] * (len(hyp_chars) + 1) for _ in range(len(ref_chars) + 1)]
+    # Identical or one-sided inputs: the distance is the other side's length
+    if reference == hypothesis or not reference or not hypothesis:
+        distance = 0 if reference == hypothesis else max(n, len(hypothesis))
+        return distance / n if n > 0 else 0.0
 
-    for i in range(len(ref_chars) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_chars) + 1):
-        d[0][j] = j
+    if HAS_RAPIDFUZZ:
+        return Levenshtein.distance(reference, hypothesis) / n
 
-    for i in range(1, len(ref_chars) + 1):
-        for j in range(1, len(hyp_chars) + 1):
-            if ref_chars[i-1] == hyp_chars[j-1]:
-                d[i][j] = d[i-1][j-1]
+    # Simple Levenshtein distance at character level, two rows at a time
+    prev = list(range(len(hypothesis) + 1))
+    curr = [0] * (len(hypothesis) + 1)
+
+    for i, ref_char in enumerate(reference, 1):
+        curr[0] = i
+        for j, hyp_char in enumerate(hypothesis, 1):
+            if ref_char == hyp_char:
+                curr[j] = prev[j-1]
             else:
-                d[i][j] = min(d[i-1][j-1] + 1,  # substitution
-                            d[i][j-1] + 1,      # insertion
-                            d[i-1][j] + 1)      # deletion
+                curr[j] = min(prev[j-1] + 1,  # substitution
+                              curr[j-1] + 1,  # insertion
+                              prev[j] + 1)    # deletion
+        prev, curr = curr, prev
 
-    n = len(ref_chars)
-    return d[len(ref_chars)][len(hyp_chars)] / n if n > 0 else 0.0
+    return prev[-1] / n
 
 
 def calculate_jaccard_similarity(reference: str, hypothesis: str) -> float:
@@ -165,8 +203,11 @@ def calculate_jaccard_similarity(reference: str, hypothesis: str) -> float:
     ref_words = set(reference.split())
     hyp_words = set(hypothesis.split())
 
-    if not ref_words and not hyp_words:
+    # Identical sets (both empty included) match fully, one empty side shares nothing
+    if ref_words == hyp_words:
         return 1.0
+    if not ref_words or not hyp_words:
+        return 0.0
 
     intersection = len(ref_words & hyp_words)
     union = len(ref_words | hyp_words)
@@ -188,25 +229,38 @@ def calculate_cosine_similarity(reference: str, hypothesis: str) -> float:
     ref_counter = Counter(reference.split())
     hyp_counter = Counter(hypothesis.split())
 
-    # Get all unique words
-    all_words = set(ref_counter.keys()) | set(hyp_counter.keys())
-
-    if not all_words:
+    # Same word frequencies (both empty included) point the same way exactly,
+    # a zero vector on one side has no direction to share
+    if ref_counter == hyp_counter:
         return 1.0
+    if not ref_counter or not hyp_counter:
+        return 0.0
 
-    # Build vectors
-    ref_vec = [ref_counter.get(word, 0) for word in all_words]
-    hyp_vec = [hyp_counter.get(word, 0) for word in all_words]
+    # Dot product over the smaller counter, words missing from either side add nothing
+    small, large = sorted((ref_counter, hyp_counter), key=len)
+    dot_product = sum(count * large[word] for word, count in small.items())
+    ref_magnitude = math.sqrt(sum(count * count for count in ref_counter.values()))
+    hyp_magnitude = math.sqrt(sum(count * count for count in hyp_counter.values()))
 
-    # Calculate cosine similarity
-    dot_product = sum(r * h for r, h in zip(ref_vec, hyp_vec))
-    ref_magnitude = math.sqrt(sum(r * r for r in ref_vec))
-    hyp_magnitude = math.sqrt(sum(h * h for h in hyp_vec))
+    return dot_product / (ref_magnitude * hyp_magnitude)
 
-    if ref_magnitude == 0 or hyp_magnitude == 0:
-        return 0.0
 
-    return dot_product / (ref_magnitude * hyp_magnitude)
+def _identical_results(word_count: int) -> Dict[str, float]:
+    """compare_transcriptions results for a hypothesis equal to its reference."""
+    return {
+        'wer': 0.0,
+        'cer': 0.0,
+        'substitutions': 0,
+        'deletions': 0,
+        'insertions': 0,
+        'total_edits': 0,
+        'word_count_ref': word_count,
+        'word_count_hyp': word_count,
+        'word_count_diff': 0,
+        'word_count_diff_pct': 0.0,
+        'jaccard_similarity': 1.0,
+        'cosine_similarity': 1.0,
+    }
 
 
 def compare_transcriptions(
@@ -233,6 +287,10 @@ def compare_transcriptions(
         ref_normalized = reference_text
         hyp_normalized = hypothesis_text
 
+    # Identical after normalisation: a perfect score, no metric needs computing
+    if ref_normalized == hyp_normalized:
+        return _identical_results(len(ref_normalized.split()))
+
     # Calculate all metrics
     wer_results = calculate_wer(ref_normalized, hyp_normalized)
     cer = calculate_cer(ref_normalized, hyp_normalized)
@@ -259,3 +317,30 @@ def compare_transcriptions(
         'jaccard_similarity': jaccard,
         'cosine_similarity': cosine,
     }
+
+
+def compare_transcriptions_batch(
+    reference_text: str,
+    hypothesis_texts: List[str],
+    normalize: bool = True
+) -> List[Dict[str, float]]:
+    """
+    Compare many transcriptions against one reference.
+
+    Args:
+        reference_text: Ground truth transcription
+        hypothesis_texts: Transcriptions to evaluate
+        normalize: Whether to normalize text before comparison
+
+    Returns:
+        compare_transcriptions results, in the order of hypothesis_texts
+    """
+    # The reference is normalised once rather than once per hypothesis
+    if normalize:
+        reference_text = normalize_text(reference_text)
+        hypothesis_texts = [normalize_text(text) for text in hypothesis_texts]
+
+    return [
+        compare_transcriptions(reference_text, text, normalize=False)
+        for text in hypothesis_texts
+    ]
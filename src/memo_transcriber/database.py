@@ -3,24 +3,29 @@ Database management for memo transcriber - handles transcription cache, processi
 """
 
 import sqlite3
+import functools
 import hashlib
 import time
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 import json
 
+from .sqlite_pragmas import apply_pragmas
 
+
+@functools.lru_cache(maxsize=1)
 def get_user_data_dir() -> Path:
-    """Get the user data directory for memo transcriber."""
+    """Get the user data directory for memo transcriber, created on first call."""
     data_dir = Path.home() / '.local' / 'share' / 'memo-transcriber'
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionRecord:
     """Database record for a transcribed memo.
 
@@ -57,8 +62,13 @@ class TranscriptionRecord:
     processing_time_seconds: Optional[float] = None
     is_reference: int = 0
 
+    @property
+    def duration_minutes(self) -> float:
+        """Recording length in minutes, 0.0 when it was never recorded."""
+        return (self.duration_seconds or 0.0) / 60.0
+
 
-@dataclass
+@dataclass(slots=True)
 class ExportRecord:
     """Database record for file export tracking.
 
@@ -84,7 +94,7 @@ class ExportRecord:
     export_format: str = 'txt'
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingBatch:
     """Database record for processing batch metadata.
 
@@ -114,7 +124,7 @@ class ProcessingBatch:
     avg_processing_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelTranscriptionRecord:
     """Database record for model-specific transcription.
 
@@ -134,6 +144,7 @@ class ModelTranscriptionRecord:
         file_path: Path to audio file (denormalized)
         duration_seconds: Audio duration (denormalized)
         recording_date: Recording date (denormalized)
+        word_count: Number of words in the transcription, stored on save
     """
     memo_uuid: str
     model_used: str
@@ -150,9 +161,10 @@ class ModelTranscriptionRecord:
     file_path: Optional[str] = None
     duration_seconds: Optional[float] = None
     recording_date: Optional[str] = None
+    word_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonRecord:
     """Database record for transcription comparison results.
 
@@ -194,6 +206,63 @@ class ComparisonRecord:
     notes: Optional[str] = None
 
 
+# Successful transcriptions without a successful export; each NOT EXISTS
+# probe is one lookup on idx_file_exports_uuid_status
+_UNEXPORTED_FILTER = """
+    WHERE t.status = 'success'
+      AND NOT EXISTS (
+          SELECT 1 FROM file_exports e
+          WHERE e.uuid = t.uuid AND e.export_status = 'success'
+      )
+"""
+
+_UNEXPORTED_COUNT_QUERY = "SELECT COUNT(*) FROM transcriptions t" + _UNEXPORTED_FILTER
+
+# Every transcriptions column in TranscriptionRecord field order, so rows are
+# passed positionally; NULL timings stay None so exports can tell "not timed"
+# from zero. {transcription} is the full column, or a leading preview of it
+_TRANSCRIPTION_COLUMNS_TEMPLATE = """
+    uuid, plain_title, folder_name, file_path, output_file_path,
+    {transcription},
+    status, error_message, duration_seconds,
+    recording_date, processed_at, file_hash, model_used,
+    processing_time_seconds, is_reference
+"""
+
+_TRANSCRIPTION_COLUMNS = _TRANSCRIPTION_COLUMNS_TEMPLATE.format(
+    transcription="transcription")
+# The same columns, with the transcript cut down to its first ? characters
+_TRANSCRIPTION_PREVIEW_COLUMNS = _TRANSCRIPTION_COLUMNS_TEMPLATE.format(
+    transcription="substr(transcription, 1, ?) AS transcription")
+
+
+# Insert shared by save_model_comparison and save_model_comparisons,
+# replacing any earlier result for the same pair
+_MODEL_COMPARISON_INSERT = """
+    INSERT OR REPLACE INTO transcription_comparisons (
+        reference_id, hypothesis_id, wer, cer,
+        substitutions, deletions, insertions, total_edits,
+        word_count_ref, word_count_hyp, word_count_diff,
+        word_count_diff_pct, jaccard_similarity, cosine_similarity,
+        notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Insert shared by record_export and record_exports
+_EXPORT_INSERT = """
+    INSERT INTO file_exports (
+        uuid, output_file_path, file_size_bytes, checksum,
+        export_status, error_message, export_format
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# ORDER BY clauses get_comparisons_for_memo accepts, keyed by order_by
+_COMPARISON_ORDER = {
+    'recent': "c.compared_at DESC",
+    'wer': "c.wer ASC, c.compared_at DESC",
+}
+
+
 class MemoDatabase:
     """Manages SQLite database for memo transcription data."""
 
@@ -205,11 +274,54 @@ class MemoDatabase:
         else:
             # Allow custom path (for testing, etc.)
             self.db_path = Path(db_path)
+        # Records by UUID, dropped whenever this instance writes that UUID
+        self._transcription_cache: Dict[str, TranscriptionRecord] = {}
+        # Long-lived connections keyed by read_only, tuned once and reused per call
+        self._conns: Dict[bool, sqlite3.Connection] = {}
         self.init_database()
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection, read-only ones use a `mode=ro` URI."""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        return apply_pragmas(conn)
+
+    def _connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """This instance's connection of the given kind, opened on first use."""
+        conn = self._conns.get(read_only)
+        if conn is None:
+            conn = self._conns[read_only] = self._connect(read_only)
+        return conn
+
+    def close(self) -> None:
+        """Close the instance's connections, later calls reopen them."""
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+    def __enter__(self) -> "MemoDatabase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def _session(self, read_only: bool = False) -> Iterator[sqlite3.Connection]:
+        """Yield the reused connection, committed on exit."""
+        conn = self._connection(read_only)
+        # Left over from the previous call, methods wanting sqlite3.Row set it themselves
+        conn.row_factory = None
+        with conn:
+            yield conn
+
     def init_database(self) -> None:
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
+            # Persistent: readers stop blocking on the writer from here on
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS transcriptions (
                     uuid TEXT PRIMARY KEY,
@@ -272,6 +384,7 @@ class MemoDatabase:
                     file_path TEXT,
                     duration_seconds REAL,
                     recording_date TEXT,
+                    word_count INTEGER,
                     UNIQUE(memo_uuid, model_used)
                 );
 
@@ -297,51 +410,104 @@ class MemoDatabase:
                     FOREIGN KEY (hypothesis_id) REFERENCES model_transcriptions(id)
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_transcriptions_status ON transcriptions(status);
+                -- SHA-256 of audio files, valid while path, mtime and size are unchanged
+                CREATE TABLE IF NOT EXISTS file_hash_cache (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    file_hash TEXT NOT NULL
+                );
+
+                -- Superseded by the composite and partial indexes below
+                DROP INDEX IF EXISTS idx_transcriptions_status;
+                DROP INDEX IF EXISTS idx_file_exports_uuid;
+                DROP INDEX IF EXISTS idx_transcriptions_reference;
+
+                -- Match the listing order, uuid breaks processed_at ties for keyset paging
+                CREATE INDEX IF NOT EXISTS idx_transcriptions_status_recent ON transcriptions(status, processed_at DESC, uuid DESC);
+                CREATE INDEX IF NOT EXISTS idx_transcriptions_recent ON transcriptions(processed_at DESC, uuid DESC);
                 CREATE INDEX IF NOT EXISTS idx_transcriptions_folder ON transcriptions(folder_name);
-                CREATE INDEX IF NOT EXISTS idx_transcriptions_reference ON transcriptions(is_reference);
-                CREATE INDEX IF NOT EXISTS idx_file_exports_uuid ON file_exports(uuid);
+                CREATE INDEX IF NOT EXISTS idx_transcriptions_is_reference ON transcriptions(is_reference) WHERE is_reference = 1;
+                CREATE INDEX IF NOT EXISTS idx_file_exports_uuid_status ON file_exports(uuid, export_status);
                 CREATE INDEX IF NOT EXISTS idx_file_exports_status ON file_exports(export_status);
                 CREATE INDEX IF NOT EXISTS idx_model_trans_memo ON model_transcriptions(memo_uuid);
                 CREATE INDEX IF NOT EXISTS idx_model_trans_model ON model_transcriptions(model_used);
                 CREATE INDEX IF NOT EXISTS idx_model_trans_reference ON model_transcriptions(is_reference);
-                CREATE INDEX IF NOT EXISTS idx_comparisons_reference ON transcription_comparisons(reference_id);
+                -- Covered by the leading column of idx_comparisons_pair
+                DROP INDEX IF EXISTS idx_comparisons_reference;
                 CREATE INDEX IF NOT EXISTS idx_comparisons_hypothesis ON transcription_comparisons(hypothesis_id);
             """)
 
+            # Databases created before word_count existed need the column added
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(model_transcriptions)")}
+            if 'word_count' not in columns:
+                conn.execute("ALTER TABLE model_transcriptions ADD COLUMN word_count INTEGER")
+
+            # One comparison per (reference, hypothesis) pair. Older databases may
+            # hold repeats from re-running compare-all, keep the newest of each
+            has_pair_index = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_comparisons_pair'").fetchone()
+            if not has_pair_index:
+                conn.execute("""
+                    DELETE FROM transcription_comparisons WHERE id NOT IN (
+                        SELECT MAX(id) FROM transcription_comparisons
+                        GROUP BY reference_id, hypothesis_id
+                    )
+                """)
+                conn.execute("""
+                    CREATE UNIQUE INDEX idx_comparisons_pair
+                    ON transcription_comparisons(reference_id, hypothesis_id)
+                """)
+
     def get_file_hash(self, file_path: str) -> Optional[str]:
         """Calculate SHA-256 hash of a file."""
         try:
-            hash_sha256 = hashlib.sha256()
+            # file_digest reads into a reused buffer and hashes in C, no Python loop
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                return hashlib.file_digest(f, "sha256").hexdigest()
         except (FileNotFoundError, PermissionError):
             return None
 
-    def is_file_processed(self, uuid: str, file_path: str) -> bool:
-        """Check if file has been processed and hasn't changed."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+    def get_or_compute_file_hash(self, file_path: str) -> Optional[str]:
+        """SHA-256 of a file, read from file_hash_cache while its mtime and size match.
 
-            cursor.execute("""
-                SELECT file_hash, status FROM transcriptions
-                WHERE uuid = ? AND status = 'success'
-            """, (uuid,))
+        Only a changed or new file is read and hashed; the result is stored for next time.
+        """
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, PermissionError):
+            return None
 
-            row = cursor.fetchone()
-            if not row:
-                return False
+        with self._session() as conn:
+            row = conn.execute(
+                "SELECT file_hash FROM file_hash_cache WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (file_path, st.st_mtime_ns, st.st_size)).fetchone()
+            if row:
+                return row[0]
+
+            file_hash = self.get_file_hash(file_path)
+            if file_hash is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_hash_cache (path, mtime_ns, size, file_hash) VALUES (?, ?, ?, ?)",
+                    (file_path, st.st_mtime_ns, st.st_size, file_hash))
+            return file_hash
+
+    def is_file_processed(self, uuid: str, file_path: str) -> bool:
+        """Check if file has been processed and hasn't changed."""
+        # Goes through the record cache, so the organiser's follow-up
+        # get_transcription for the same UUID doesn't query again
+        record = self.get_transcription(uuid)
+        if not record or record.status != 'success':
+            return False
 
-            # Check if file hash matches (file hasn't changed)
-            current_hash = self.get_file_hash(file_path)
-            return current_hash == row['file_hash']
+        # Check if file hash matches (file hasn't changed)
+        current_hash = self.get_or_compute_file_hash(file_path)
+        return current_hash == record.file_hash
 
     def save_transcription(self, record: TranscriptionRecord) -> None:
         """Save or update a transcription record."""
-        with sqlite3.connect(self.db_path) as conn:
+        self._transcription_cache.pop(record.uuid, None)
+        with self._session() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO transcriptions (
                     uuid, plain_title, folder_name, file_path, output_file_path,
@@ -358,34 +524,95 @@ class MemoDatabase:
             ))
 
     def get_transcription(self, uuid: str) -> Optional[TranscriptionRecord]:
-        """Retrieve a transcription record by UUID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        """Retrieve a transcription record by UUID, cached per instance."""
+        cached = self._transcription_cache.get(uuid)
+        if cached is not None:
+            return cached
+
+        with self._session() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT * FROM transcriptions WHERE uuid = ?", (uuid,))
+            cursor.execute(f"SELECT {_TRANSCRIPTION_COLUMNS} FROM transcriptions WHERE uuid = ?", (uuid,))
             row = cursor.fetchone()
 
             if row:
-                return TranscriptionRecord(**dict(row))
+                record = TranscriptionRecord(*row)
+                self._transcription_cache[uuid] = record
+                return record
             return None
 
-    def get_all_transcriptions(self, status_filter: Optional[str] = None) -> List[TranscriptionRecord]:
-        """Get all transcription records, optionally filtered by status."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            if status_filter:
-                cursor.execute("SELECT * FROM transcriptions WHERE status = ? ORDER BY processed_at DESC", (status_filter,))
+    def get_all_transcriptions(self, status_filter: Optional[str] = None,
+                               limit: Optional[int] = None, offset: int = 0,
+                               after: Optional[Tuple[Optional[str], str]] = None,
+                               preview_chars: Optional[int] = None) -> List[TranscriptionRecord]:
+        """Get transcription records, newest first, optionally filtered by status.
+
+        limit and offset are applied in SQL; limit=None returns every row.
+        after is a (processed_at, uuid) keyset cursor: only records that sort
+        after it in newest-first order are returned. Records with no
+        processed_at sort last; a cursor on one of them has processed_at None.
+        """
+        return list(self.iter_transcriptions(status_filter, limit, offset, after, preview_chars))
+
+    def iter_transcriptions(self, status_filter: Optional[str] = None,
+                            limit: Optional[int] = None, offset: int = 0,
+                            after: Optional[Tuple[Optional[str], str]] = None,
+                            preview_chars: Optional[int] = None) -> Iterator[TranscriptionRecord]:
+        """Yield transcription records straight off the cursor, see get_all_transcriptions.
+
+        With preview_chars set, record.transcription holds only that many leading
+        characters, so listings don't pull every full transcript out of SQLite.
+        """
+        where, params = self._transcription_filter(status_filter, after)
+        if preview_chars is None:
+            columns = _TRANSCRIPTION_COLUMNS
+        else:
+            columns = _TRANSCRIPTION_PREVIEW_COLUMNS
+            params = (preview_chars, *params)
+        # SQLite treats a negative LIMIT as no limit
+        params = (*params, -1 if limit is None else limit, offset)
+
+        with self._session(read_only=True) as conn:
+            cursor = conn.execute(
+                f"SELECT {columns} FROM transcriptions{where} "
+                "ORDER BY processed_at DESC, uuid DESC LIMIT ? OFFSET ?", params)
+
+            for row in cursor:
+                yield TranscriptionRecord(*row)
+
+    def count_transcriptions(self, status_filter: Optional[str] = None,
+                             after: Optional[Tuple[Optional[str], str]] = None) -> int:
+        """Count transcription records, filtered as in get_all_transcriptions."""
+        where, params = self._transcription_filter(status_filter, after)
+        with self._session(read_only=True) as conn:
+            row = conn.execute(f"SELECT COUNT(*) FROM transcriptions{where}", params).fetchone()
+            return row[0]
+
+    @staticmethod
+    def _transcription_filter(status_filter: Optional[str],
+                              after: Optional[Tuple[Optional[str], str]]) -> Tuple[str, Tuple[Any, ...]]:
+        """Build the WHERE clause and parameters shared by the listing queries."""
+        clauses, params = [], []
+        if status_filter:
+            clauses.append("status = ?")
+            params.append(status_filter)
+        if after is not None:
+            processed_at, uuid = after
+            if processed_at is None:
+                # Already among the undated rows, which come last ordered by uuid alone
+                clauses.append("processed_at IS NULL AND uuid < ?")
+                params.append(uuid)
             else:
-                cursor.execute("SELECT * FROM transcriptions ORDER BY processed_at DESC")
-
-            return [TranscriptionRecord(**dict(row)) for row in cursor.fetchall()]
+                # Row-value comparison walks the (processed_at, uuid) index from the
+                # cursor; NULL never compares less, so the undated rows are added back
+                clauses.append("((processed_at, uuid) < (?, ?) OR processed_at IS NULL)")
+                params.extend(after)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, tuple(params)
 
     def start_processing_batch(self, batch_id: str, total_files: int, settings: Dict[str, Any], model_used: str) -> None:
         """Record the start of a processing batch."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.execute("""
                 INSERT INTO processing_metadata (
                     batch_id, total_files, settings_json, model_used
@@ -394,7 +621,7 @@ class MemoDatabase:
 
     def finish_processing_batch(self, batch_id: str, success_count: int, failed_count: int, skipped_count: int, avg_time: float) -> None:
         """Update processing batch with completion data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.execute("""
                 UPDATE processing_metadata
                 SET completed_at = CURRENT_TIMESTAMP,
@@ -405,41 +632,50 @@ class MemoDatabase:
                 WHERE batch_id = ?
             """, (success_count, failed_count, skipped_count, avg_time, batch_id))
 
+    @staticmethod
+    def _export_params(export_record: ExportRecord) -> Tuple[Any, ...]:
+        """Parameters for _EXPORT_INSERT, in column order."""
+        return (
+            export_record.uuid, export_record.output_file_path,
+            export_record.file_size_bytes, export_record.checksum,
+            export_record.export_status, export_record.error_message,
+            export_record.export_format
+        )
+
     def record_export(self, export_record: ExportRecord) -> int:
         """Record a file export attempt."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO file_exports (
-                    uuid, output_file_path, file_size_bytes, checksum,
-                    export_status, error_message, export_format
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                export_record.uuid, export_record.output_file_path,
-                export_record.file_size_bytes, export_record.checksum,
-                export_record.export_status, export_record.error_message,
-                export_record.export_format
-            ))
+        with self._session() as conn:
+            cursor = conn.execute(_EXPORT_INSERT, self._export_params(export_record))
             return cursor.lastrowid
 
+    def record_exports(self, export_records: List[ExportRecord]) -> None:
+        """Record several export attempts with one prepared statement and one commit."""
+        with self._session() as conn:
+            conn.executemany(_EXPORT_INSERT,
+                             [self._export_params(r) for r in export_records])
+
     def get_unexported_transcriptions(self) -> List[TranscriptionRecord]:
         """Get all successful transcriptions that haven't been exported yet."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
+            # Only the columns the exporter reads; the rest take their defaults
             cursor.execute("""
-                SELECT t.* FROM transcriptions t
-                LEFT JOIN file_exports e ON t.uuid = e.uuid AND e.export_status = 'success'
-                WHERE t.status = 'success' AND e.uuid IS NULL
+                SELECT
+                    t.uuid, t.plain_title, t.folder_name, t.file_path,
+                    t.output_file_path, t.transcription, t.status,
+                    t.duration_seconds, t.recording_date, t.processed_at,
+                    t.model_used, t.processing_time_seconds
+                FROM transcriptions t""" + _UNEXPORTED_FILTER + """
                 ORDER BY t.processed_at
             """)
 
             return [TranscriptionRecord(**dict(row)) for row in cursor.fetchall()]
 
     def get_processing_stats(self) -> Dict[str, Any]:
-        """Get overall processing statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Get overall processing statistics, including the unexported count."""
+        with self._session(read_only=True) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -448,8 +684,9 @@ class MemoDatabase:
                 SELECT
                     status,
                     COUNT(*) as count,
-                    AVG(processing_time_seconds) as avg_time,
-                    SUM(duration_seconds) as total_duration
+                    -- NULL and 0.0 both mean "not timed", keep them out of the average
+                    COALESCE(AVG(NULLIF(processing_time_seconds, 0)), 0) as avg_time,
+                    COALESCE(SUM(duration_seconds), 0) as total_duration
                 FROM transcriptions
                 GROUP BY status
             """)
@@ -465,14 +702,19 @@ class MemoDatabase:
             """)
             export_stats = {row['export_status']: dict(row) for row in cursor.fetchall()}
 
+            # Same connection, saves db-stats opening another one
+            unexported = cursor.execute(_UNEXPORTED_COUNT_QUERY).fetchone()[0]
+
             return {
                 'transcriptions': transcription_stats,
-                'exports': export_stats
+                'exports': export_stats,
+                'unexported': unexported
             }
 
     def mark_as_reference(self, uuid: str) -> None:
         """Mark a transcription as a reference (ground truth) transcription."""
-        with sqlite3.connect(self.db_path) as conn:
+        self._transcription_cache.pop(uuid, None)
+        with self._session() as conn:
             conn.execute("""
                 UPDATE transcriptions
                 SET is_reference = 1
@@ -481,7 +723,8 @@ class MemoDatabase:
 
     def unmark_as_reference(self, uuid: str) -> None:
         """Remove reference marking from a transcription."""
-        with sqlite3.connect(self.db_path) as conn:
+        self._transcription_cache.pop(uuid, None)
+        with self._session() as conn:
             conn.execute("""
                 UPDATE transcriptions
                 SET is_reference = 0
@@ -490,21 +733,20 @@ class MemoDatabase:
 
     def get_reference_transcriptions(self) -> List[TranscriptionRecord]:
         """Get all transcriptions marked as reference."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._session() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM transcriptions
+            cursor.execute(f"""
+                SELECT {_TRANSCRIPTION_COLUMNS} FROM transcriptions
                 WHERE is_reference = 1
                 ORDER BY plain_title
             """)
 
-            return [TranscriptionRecord(**dict(row)) for row in cursor.fetchall()]
+            return [TranscriptionRecord(*row) for row in cursor.fetchall()]
 
     def save_comparison(self, comparison: ComparisonRecord) -> int:
         """Save a transcription comparison result."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO transcription_comparisons (
@@ -528,7 +770,7 @@ class MemoDatabase:
 
     def get_comparisons_for_reference(self, reference_uuid: str) -> List[ComparisonRecord]:
         """Get all comparisons for a specific reference transcription."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -540,9 +782,13 @@ class MemoDatabase:
 
             return [ComparisonRecord(**dict(row)) for row in cursor.fetchall()]
 
-    def get_comparison_summary_by_model(self, reference_uuid: str) -> List[Dict[str, Any]]:
-        """Get comparison summary grouped by model for a reference transcription."""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_comparison_summary_by_model(self, reference_id: int) -> List[Dict[str, Any]]:
+        """Get comparison summary grouped by model for a reference transcription.
+
+        reference_id is picked out by idx_comparisons_pair's leading column and
+        each hypothesis is a primary-key lookup, so no extra index is needed.
+        """
+        with self._session(read_only=True) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -557,11 +803,11 @@ class MemoDatabase:
                     AVG(c.jaccard_similarity) as avg_jaccard,
                     AVG(c.cosine_similarity) as avg_cosine
                 FROM transcription_comparisons c
-                JOIN transcriptions t ON c.hypothesis_uuid = t.uuid
-                WHERE c.reference_uuid = ?
+                JOIN model_transcriptions t ON c.hypothesis_id = t.id
+                WHERE c.reference_id = ?
                 GROUP BY t.model_used
                 ORDER BY avg_wer
-            """, (reference_uuid,))
+            """, (reference_id,))
 
             return [dict(row) for row in cursor.fetchall()]
 
@@ -569,26 +815,31 @@ class MemoDatabase:
 
     def save_model_transcription(self, record: ModelTranscriptionRecord) -> int:
         """Save or update a model transcription record."""
-        with sqlite3.connect(self.db_path) as conn:
+        word_count = record.word_count
+        if word_count is None:
+            word_count = len(record.transcription.split())
+
+        with self._session() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO model_transcriptions (
                     memo_uuid, model_used, transcription, status, error_message,
                     processing_time_seconds, file_hash, is_reference,
-                    plain_title, folder_name, file_path, duration_seconds, recording_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    plain_title, folder_name, file_path, duration_seconds, recording_date,
+                    word_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 record.memo_uuid, record.model_used, record.transcription,
                 record.status, record.error_message, record.processing_time_seconds,
                 record.file_hash, record.is_reference, record.plain_title,
                 record.folder_name, record.file_path, record.duration_seconds,
-                record.recording_date
+                record.recording_date, word_count
             ))
             return cursor.lastrowid
 
     def get_model_transcription(self, transcription_id: int) -> Optional[ModelTranscriptionRecord]:
         """Get a model transcription by ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM model_transcriptions WHERE id = ?", (transcription_id,))
@@ -599,7 +850,7 @@ class MemoDatabase:
 
     def get_model_transcriptions_for_memo(self, memo_uuid: str) -> List[ModelTranscriptionRecord]:
         """Get all model transcriptions for a specific memo."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -611,7 +862,7 @@ class MemoDatabase:
 
     def get_model_transcription_by_model(self, memo_uuid: str, model: str) -> Optional[ModelTranscriptionRecord]:
         """Get a specific model's transcription for a memo."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -625,7 +876,7 @@ class MemoDatabase:
 
     def mark_model_transcription_as_reference(self, transcription_id: int) -> None:
         """Mark a model transcription as reference (ground truth)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             # First, unmark any existing reference for this memo
             cursor = conn.cursor()
             cursor.execute("""
@@ -649,7 +900,7 @@ class MemoDatabase:
 
     def get_reference_for_memo(self, memo_uuid: str) -> Optional[ModelTranscriptionRecord]:
         """Get the reference transcription for a memo."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute("""
@@ -661,36 +912,50 @@ class MemoDatabase:
                 return ModelTranscriptionRecord(**dict(row))
             return None
 
+    @staticmethod
+    def _model_comparison_params(comparison: ComparisonRecord) -> Tuple[Any, ...]:
+        """Parameters for _MODEL_COMPARISON_INSERT, in column order."""
+        return (
+            comparison.reference_id, comparison.hypothesis_id,
+            comparison.wer, comparison.cer,
+            comparison.substitutions, comparison.deletions,
+            comparison.insertions, comparison.total_edits,
+            comparison.word_count_ref, comparison.word_count_hyp,
+            comparison.word_count_diff, comparison.word_count_diff_pct,
+            comparison.jaccard_similarity, comparison.cosine_similarity,
+            comparison.notes
+        )
+
     def save_model_comparison(self, comparison: ComparisonRecord) -> int:
         """Save a model transcription comparison result."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO transcription_comparisons (
-                    reference_id, hypothesis_id, wer, cer,
-                    substitutions, deletions, insertions, total_edits,
-                    word_count_ref, word_count_hyp, word_count_diff,
-                    word_count_diff_pct, jaccard_similarity, cosine_similarity,
-                    notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                comparison.reference_id, comparison.hypothesis_id,
-                comparison.wer, comparison.cer,
-                comparison.substitutions, comparison.deletions,
-                comparison.insertions, comparison.total_edits,
-                comparison.word_count_ref, comparison.word_count_hyp,
-                comparison.word_count_diff, comparison.word_count_diff_pct,
-                comparison.jaccard_similarity, comparison.cosine_similarity,
-                comparison.notes
-            ))
+        with self._session() as conn:
+            cursor = conn.execute(_MODEL_COMPARISON_INSERT, self._model_comparison_params(comparison))
             return cursor.lastrowid
 
-    def get_comparisons_for_memo(self, memo_uuid: str) -> List[Tuple[ComparisonRecord, ModelTranscriptionRecord, ModelTranscriptionRecord]]:
-        """Get all comparisons for a memo with full transcription details."""
-        with sqlite3.connect(self.db_path) as conn:
+    def save_model_comparisons(self, comparisons: List[ComparisonRecord]) -> None:
+        """Save several comparison results with one prepared statement and one commit."""
+        with self._session() as conn:
+            conn.executemany(_MODEL_COMPARISON_INSERT,
+                             [self._model_comparison_params(c) for c in comparisons])
+
+    def get_model_comparisons_for_reference(self, reference_id: int) -> Dict[int, ComparisonRecord]:
+        """Get stored comparisons against a reference, keyed by hypothesis id."""
+        with self._session(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(
+                "SELECT * FROM transcription_comparisons WHERE reference_id = ?", (reference_id,))
+            return {row['hypothesis_id']: ComparisonRecord(**dict(row)) for row in cursor}
+
+    def get_comparisons_for_memo(self, memo_uuid: str, order_by: str = 'recent') -> List[Tuple[ComparisonRecord, ModelTranscriptionRecord, ModelTranscriptionRecord]]:
+        """Get all comparisons for a memo with full transcription details.
+
+        order_by is 'recent' (newest first) or 'wer' (best first, newest breaking ties).
+        """
+        order = _COMPARISON_ORDER[order_by]
+        with self._session() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT
                     c.*,
                     ref.model_used as ref_model,
@@ -701,7 +966,7 @@ class MemoDatabase:
                 JOIN model_transcriptions ref ON c.reference_id = ref.id
                 JOIN model_transcriptions hyp ON c.hypothesis_id = hyp.id
                 WHERE ref.memo_uuid = ?
-                ORDER BY c.compared_at DESC
+                ORDER BY {order}
             """, (memo_uuid,))
 
             results = []
@@ -2,21 +2,25 @@
 Faster-Whisper transcription backend.
 """
 
+import threading
 from faster_whisper import WhisperModel
 from typing import Optional
 
 
-# Global model cache to avoid reloading
-_faster_whisper_model_cache: dict[str, WhisperModel] = {}
+# Global model cache to avoid reloading, keyed by (model_size, num_workers)
+_faster_whisper_model_cache: dict[tuple[str, int], WhisperModel] = {}
+# Stops concurrent first calls from each loading their own copy
+_model_cache_lock = threading.Lock()
 
 
-def transcribe_file_faster_whisper(file_path: str, model_size: str = "base") -> str:
+def transcribe_file_faster_whisper(file_path: str, model_size: str = "base", num_workers: int = 1) -> str:
     """
     Transcribe an audio file using Faster-Whisper.
 
     Args:
         file_path: Path to the audio file
         model_size: Model size ('tiny', 'base', 'small', 'medium', 'large-v3')
+        num_workers: How many threads may transcribe with the shared model at once
 
     Returns:
         Transcribed text or error message
@@ -24,14 +28,17 @@ def transcribe_file_faster_whisper(file_path: str, model_size: str = "base") ->
     try:
         # Load model (cached after first load)
         # Use CPU with int8 for efficiency, or "auto" device for GPU if available
-        if model_size not in _faster_whisper_model_cache:
-            _faster_whisper_model_cache[model_size] = WhisperModel(
-                model_size,
-                device="cpu",
-                compute_type="int8"
-            )
-
-        model = _faster_whisper_model_cache[model_size]
+        key = (model_size, num_workers)
+        with _model_cache_lock:
+            if key not in _faster_whisper_model_cache:
+                _faster_whisper_model_cache[key] = WhisperModel(
+                    model_size,
+                    device="cpu",
+                    compute_type="int8",
+                    num_workers=num_workers
+                )
+
+        model = _faster_whisper_model_cache[key]
 
         # Transcribe - returns segments and info
         segments, info = model.transcribe(file_path, beam_size=5)
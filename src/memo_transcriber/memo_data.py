@@ -1,11 +1,11 @@
 import sqlite3
-from .voicememo_db import get_db_path, get_memos_with_folders
+from .voicememo_db import get_memo_with_folder, get_memos_with_folders, pooled
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceMemoFile:
     """Represents a Voice Memo file with its metadata.
 
@@ -31,7 +31,7 @@ class VoiceMemoFile:
                         f"path={self.f_path}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoiceMemoFolder:
     """Represents a Voice Memos folder with its metadata.
 
@@ -52,7 +52,7 @@ class VoiceMemoFolder:
         return f"Folder(id={self.uuid}, name='{self.plain_name}', recordings={self.recording_count})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UnassignedRecordings:
     """Represents recordings not assigned to any folder.
 
@@ -68,22 +68,119 @@ class UnassignedRecordings:
         return f"Unassigned(folder_id={folder_desc}, recordings={self.count})"
 
 
-def get_memo_data(db_path: str) -> List[VoiceMemoFile]:
-    memos = get_memos_with_folders(db_path)
-    memo_files = []
+# Query text lives at module level so it stays identical across calls and
+# hits the connection's prepared-statement cache
 
-    for record in memos:
-        memo = VoiceMemoFile(
-            uuid=record['recording_id'] or '',
-            plain_title=record['plain_title'] or 'Untitled',
-            f_path=record['file_path'] or '',
-            memo_folder=record['folder_name'] or 'Unassigned',
-            duration_seconds=record['duration_seconds'] or 0.0,
-            recording_date=record['recording_date']
-        )
-        memo_files.append(memo)
+# Query all folders with their metadata
+_FOLDERS_QUERY = """
+SELECT 
+    Z_PK as pk,
+    ZENCRYPTEDNAME as plain_name,
+    ZUUID as uuid,
+    ZRANK as rank,
+    ZCOUNTOFRECORDINGS as recording_count
+FROM ZFOLDER 
+ORDER BY ZRANK ASC
+"""
 
-    return memo_files
+# Folder metadata plus actual recording count per folder
+_FOLDER_USAGE_QUERY = """
+SELECT 
+    f.Z_PK as pk,
+    f.ZENCRYPTEDNAME as plain_name,
+    f.ZUUID as uuid,
+    f.ZRANK as rank,
+    f.ZCOUNTOFRECORDINGS as recording_count,
+    COUNT(r.Z_PK) as actual_count
+FROM ZFOLDER f
+LEFT JOIN ZCLOUDRECORDING r ON r.ZFOLDER = f.Z_PK
+GROUP BY f.Z_PK
+ORDER BY f.ZRANK ASC
+"""
+
+# Recordings with no matching folder (NULL, 0, negative or orphaned IDs).
+# No ORDER BY: the rows land in a dict, so sorting them is wasted work
+_UNMATCHED_USAGE_QUERY = """
+SELECT 
+    r.ZFOLDER as folder_id,
+    COUNT(*) as actual_count
+FROM ZCLOUDRECORDING r
+LEFT JOIN ZFOLDER f ON f.Z_PK = r.ZFOLDER
+WHERE f.Z_PK IS NULL
+GROUP BY r.ZFOLDER
+"""
+
+# Recordings pointing at positive folder IDs that have no ZFOLDER row
+_ORPHANED_FOLDERS_QUERY = """
+SELECT 
+    r.ZFOLDER as folder_id,
+    COUNT(*) as recording_count
+FROM ZCLOUDRECORDING r
+LEFT JOIN ZFOLDER f ON f.Z_PK = r.ZFOLDER
+WHERE r.ZFOLDER IS NOT NULL
+  AND r.ZFOLDER > 0
+  AND f.Z_PK IS NULL
+GROUP BY r.ZFOLDER
+ORDER BY folder_id
+"""
+
+# Any index whose leading column is ZCLOUDRECORDING.ZFOLDER
+_FOLDER_INDEX_QUERY = """
+SELECT il.name
+FROM pragma_index_list('ZCLOUDRECORDING') il
+JOIN pragma_index_info(il.name) ii
+WHERE ii.name = 'ZFOLDER' AND ii.seqno = 0
+LIMIT 1
+"""
+
+# Query for recordings that are unassigned (ZFOLDER is NULL, 0, or negative)
+_UNASSIGNED_DETAILS_QUERY = """
+SELECT 
+    Z_PK as pk,
+    ZCUSTOMLABEL as title,
+    ZENCRYPTEDTITLE as plain_name,
+    ZPATH as path,
+    ZDURATION as duration,
+    ZDATE as date_timestamp,
+    ZFOLDER as folder_id,
+    ZUNIQUEID as unique_id,
+    datetime(ZDATE + 978307200, 'unixepoch') as formatted_date
+FROM ZCLOUDRECORDING 
+WHERE ZFOLDER IS NULL 
+   OR ZFOLDER = 0 
+   OR ZFOLDER < 0
+ORDER BY ZDATE DESC
+"""
+
+
+def _to_memo_file(record: Dict) -> VoiceMemoFile:
+    """Build a VoiceMemoFile from a voicememo_db recording dict."""
+    return VoiceMemoFile(
+        uuid=record['recording_id'] or '',
+        plain_title=record['plain_title'] or 'Untitled',
+        f_path=record['file_path'] or '',
+        memo_folder=record['folder_name'] or 'Unassigned',
+        duration_seconds=record['duration_seconds'] or 0.0,
+        recording_date=record['recording_date']
+    )
+
+
+def get_memo_data(db_path: str, folder: Optional[str] = None) -> List[VoiceMemoFile]:
+    memos = get_memos_with_folders(db_path, folder=folder)
+    return [_to_memo_file(record) for record in memos]
+
+
+def get_memo_by_uuid(db_path: str, uuid: str) -> Optional[VoiceMemoFile]:
+    """
+    Look up a single memo by its recording UUID.
+
+    Reasoning:
+        - Commands that act on one memo used to load every recording and scan
+          for the UUID in Python, the WHERE clause lets SQLite return one row
+        - No index is created for ZUNIQUEID: Apple's db is opened read-only
+    """
+    record = get_memo_with_folder(db_path, uuid)
+    return None if record is None else _to_memo_file(record)
 
 
 
@@ -105,42 +202,19 @@ def query_folder_structure(db_path: str) -> Dict[int, VoiceMemoFolder]:
         - We need to understand if there's a hierarchy (parent-child relationships)
     """
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    with pooled(db_path) as conn:
+        return _query_folder_structure(conn)
+
+
+def _query_folder_structure(conn: sqlite3.Connection) -> Dict[int, VoiceMemoFolder]:
+    """Run the folder structure query on an already open connection."""
+    cursor = conn.execute(_FOLDERS_QUERY)
     
-    try:
-        cursor = conn.cursor()
-        
-        # Query all folders with their metadata
-        query = """
-        SELECT 
-            Z_PK as pk,
-            ZENCRYPTEDNAME as plain_name,
-            ZUUID as uuid,
-            ZRANK as rank,
-            ZCOUNTOFRECORDINGS as recording_count
-        FROM ZFOLDER 
-        ORDER BY ZRANK ASC
-        """
-        
-        cursor.execute(query)
-        rows = cursor.fetchall()
+    folders = {}
+    for pk, enc, uuid, rank, cnt in cursor:
+        folders[pk] = VoiceMemoFolder(pk, enc or 'Unnamed', uuid or '', rank or 0, cnt or 0)
         
-        folders = {}
-        for row in rows:
-            folder = VoiceMemoFolder(
-                pk=row['pk'],
-                plain_name=row['plain_name'] or 'Unnamed',
-                uuid=row['uuid'] or '',
-                rank=row['rank'] or 0,
-                recording_count=row['recording_count'] or 0
-            )
-            folders[folder.pk] = folder
-            
-        return folders
-        
-    finally:
-        conn.close()
+    return folders
 
 def analyze_folder_usage(db_path: str) -> Tuple[Dict[int, VoiceMemoFolder], Dict[Optional[int], int]]:
     """
@@ -153,39 +227,56 @@ def analyze_folder_usage(db_path: str) -> Tuple[Dict[int, VoiceMemoFolder], Dict
         - We need to cross-reference ZCLOUDRECORDING.ZFOLDER with actual folder data
         - This will show us which folders are actually used
         - Help identify orphaned recordings (ZFOLDER = NULL or 0)
+        - Folders and their recording counts come back from one LEFT JOIN so
+          SQLite does the aggregation instead of a Python merge
+        - Recordings that don't match any folder row are counted separately
     """
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    
-    try:
-        # Get folder structure
-        folders = query_folder_structure(db_path)
-        
-        # Count actual recordings per folder
-        cursor = conn.cursor()
-        usage_query = """
-        SELECT 
-            ZFOLDER as folder_id,
-            COUNT(*) as actual_count
-        FROM ZCLOUDRECORDING 
-        GROUP BY ZFOLDER
-        ORDER BY folder_id
-        """
-        
-        cursor.execute(usage_query)
-        usage_rows = cursor.fetchall()
+    with pooled(db_path) as conn:
+        cursor = conn.execute(_FOLDER_USAGE_QUERY)
         
+        folders = {}
         folder_usage = {}
-        for row in usage_rows:
-            folder_id = row['folder_id']
-            actual_count = row['actual_count']
-            folder_usage[folder_id] = actual_count
+        for pk, enc, uuid, rank, cnt, actual_count in cursor:
+            folders[pk] = VoiceMemoFolder(pk, enc or 'Unnamed', uuid or '', rank or 0, cnt or 0)
+            if actual_count:
+                folder_usage[pk] = actual_count
+
+        # (folder_id, count) rows feed straight into the dict in C
+        folder_usage.update(conn.execute(_UNMATCHED_USAGE_QUERY))
             
         return folders, folder_usage
+
+
+def has_folder_index(db_path: str) -> bool:
+    """
+    Check whether ZCLOUDRECORDING.ZFOLDER is indexed.
+    
+    Reasoning:
+        - The per-folder counts GROUP BY / JOIN on ZFOLDER, without an index
+          every call scans the whole recordings table
+        - Core Data normally creates ZCLOUDRECORDING_ZFOLDER_INDEX itself
+        - We never create one: Apple's db is opened read-only and must not be mutated
+    """
+    
+    with pooled(db_path) as conn:
+        return conn.execute(_FOLDER_INDEX_QUERY).fetchone() is not None
+
+
+def get_orphaned_folder_usage(db_path: str) -> List[Tuple[int, int]]:
+    """
+    Find recordings assigned to folder IDs that don't exist in ZFOLDER.
+    
+    Returns:
+        List of (folder_id, recording_count) tuples, ordered by folder ID
         
-    finally:
-        conn.close()
+    Reasoning:
+        - SQLite answers this with a single anti-join, no Python set arithmetic
+        - NULL, 0 and negative IDs are excluded, they're reported as unassigned
+    """
+    
+    with pooled(db_path) as conn:
+        return conn.execute(_ORPHANED_FOLDERS_QUERY).fetchall()
 
 
 def get_unassigned_recordings(folder_usage: Dict[Optional[int], int]) -> List[UnassignedRecordings]:
@@ -245,55 +336,22 @@ def list_unassigned_recording_details(db_path: str) -> List[Dict]:
             print(f"  Date: {recording['date']}")
     """
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    
-    try:
-        cursor = conn.cursor()
-        
-        # Query for recordings that are unassigned (ZFOLDER is NULL, 0, or negative)
-        query = """
-        SELECT 
-            Z_PK as pk,
-            ZCUSTOMLABEL as title,
-            ZENCRYPTEDTITLE as plain_name,
-            ZPATH as path,
-            ZDURATION as duration,
-            ZDATE as date_timestamp,
-            ZFOLDER as folder_id,
-            ZUNIQUEID as unique_id,
-            datetime(ZDATE + 978307200, 'unixepoch') as formatted_date
-        FROM ZCLOUDRECORDING 
-        WHERE ZFOLDER IS NULL 
-           OR ZFOLDER = 0 
-           OR ZFOLDER < 0
-        ORDER BY ZDATE DESC
-        """
-        
-        cursor.execute(query)
-        rows = cursor.fetchall()
+    with pooled(db_path) as conn:
+        cursor = conn.execute(_UNASSIGNED_DETAILS_QUERY)
         
         recordings = []
-        for row in rows:
+        for (pk, title, plain_name, path, duration, date_timestamp,
+             folder_id, unique_id, formatted_date) in cursor:
             recordings.append({
-                'pk': row['pk'],
-                'title': row['title'] or 'Untitled',
-                'name': row['plain_name'] or 'Unnamed',
-                'path': row['path'] or '',
-                'duration': row['duration'] or 0.0,
-                'date_timestamp': row['date_timestamp'],
-                'formatted_date': row['formatted_date'],
-                'folder_id': row['folder_id'],
-                'unique_id': row['unique_id'] or '',
+                'pk': pk,
+                'title': title or 'Untitled',
+                'name': plain_name or 'Unnamed',
+                'path': path or '',
+                'duration': duration or 0.0,
+                'date_timestamp': date_timestamp,
+                'formatted_date': formatted_date,
+                'folder_id': folder_id,
+                'unique_id': unique_id or '',
             })
             
         return recordings
-        
-    finally:
-        conn.close()
-
-
-if __name__ == "__main__":
-    import sys
-    db_p = get_db_path()
-    globals()[sys.argv[1]](db_p)
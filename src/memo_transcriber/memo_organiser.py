@@ -2,7 +2,7 @@
 Memo Organiser - Processes voice memo files and creates structured transcription data.
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import time
@@ -11,12 +11,13 @@ import re
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from .memo_data import VoiceMemoFile
 from .transcriber import transcribe_file
 from .voicememo_db import cli_get_rec_path
 from .database import MemoDatabase, TranscriptionRecord, ExportRecord
-from .model_config import TranscriptionModel, get_default_model
+from .model_config import TranscriptionModel, get_default_model, get_model_info
 
 try:
     from tqdm import tqdm
@@ -25,7 +26,7 @@ except ImportError:
     HAS_TQDM = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganisedMemo:
     """Structured memo data with transcription.
 
@@ -81,9 +82,21 @@ class MemoOrganiser:
                       skip_missing: bool = True,
                       framework: bool = True,
                       max_duration_minutes: float = 8.0,
-                      model: Optional[TranscriptionModel] = None) -> List[OrganisedMemo]:
+                      model: Optional[TranscriptionModel] = None,
+                      workers: int = 1) -> List[OrganisedMemo]:
+        """Organise memo files with transcriptions, see iter_organise_memos."""
+        return list(self.iter_organise_memos(memo_files, transcribe, skip_missing, framework,
+                                             max_duration_minutes, model, workers))
+
+    def iter_organise_memos(self, memo_files: List[VoiceMemoFile],
+                            transcribe: bool = True,
+                            skip_missing: bool = True,
+                            framework: bool = True,
+                            max_duration_minutes: float = 8.0,
+                            model: Optional[TranscriptionModel] = None,
+                            workers: int = 1) -> Iterator[OrganisedMemo]:
         """
-        Organise memo files with transcriptions.
+        Organise memo files with transcriptions, yielding each memo as it's done.
 
         Args:
             memo_files: List of VoiceMemoFile objects
@@ -92,9 +105,10 @@ class MemoOrganiser:
             framework: True for Apple Speech framework, False for local model (deprecated, use model parameter)
             max_duration_minutes: Skip files longer than this (in minutes)
             model: Transcription model to use (overrides framework parameter)
+            workers: Parallel transcriptions, faster-whisper only; other engines run one at a time
 
-        Returns:
-            List of OrganisedMemo objects
+        Yields:
+            OrganisedMemo objects in input order, whatever the number of workers
         """
         # Use model parameter if provided, otherwise fall back to framework parameter
         if model is None:
@@ -102,7 +116,10 @@ class MemoOrganiser:
                 model = TranscriptionModel.APPLE_SPEECH
             else:
                 model = get_default_model()
-        organised = []
+
+        # Only faster-whisper (CTranslate2) is safe to call from several threads at once
+        if get_model_info(model).engine != "faster-whisper":
+            workers = 1
 
         # Start processing batch tracking
         batch_id = str(uuid.uuid4())
@@ -114,7 +131,8 @@ class MemoOrganiser:
                     'skip_missing': skip_missing,
                     'framework': framework,
                     'max_duration_minutes': max_duration_minutes,
-                    'model': model.value
+                    'model': model.value,
+                    'workers': workers
                 },
                 model_used=model.value
             )
@@ -134,79 +152,30 @@ class MemoOrganiser:
         success_count = failed_count = skipped_count = 0
         total_processing_time = 0.0
 
-        for memo in iterator:
-            # Generate output path for this memo
-            output_file_path = self._generate_output_path(memo)
-
-            # Check duration first (convert to minutes)
-            duration_minutes = memo.duration_seconds / 60.0
-            if duration_minutes > max_duration_minutes:
-                transcription_msg = f"Skipped: too long ({duration_minutes:.1f} min > {max_duration_minutes} min)"
-
-                # Save to database
-                if transcribe:
-                    self.db.save_transcription(TranscriptionRecord(
-                        uuid=memo.uuid,
-                        plain_title=memo.plain_title,
-                        folder_name=memo.memo_folder,
-                        file_path=memo.f_path,
-                        output_file_path=output_file_path,
-                        transcription=transcription_msg,
-                        status="skipped",
-                        duration_seconds=memo.duration_seconds,
-                        recording_date=memo.recording_date,
-                        processed_at=datetime.now().isoformat()
-                    ))
-                    skipped_count += 1
+        # Finished memos by input index, yielded once every earlier one is out
+        done: Dict[int, OrganisedMemo] = {}
+        next_index = 0
+        # Pooled transcriptions start as soon as they are found; threads only spawn on submit
+        executor = ThreadPoolExecutor(max_workers=workers) if transcribe and workers > 1 else None
+        futures = {}
 
-                organised.append(OrganisedMemo(
-                    file_path=memo.f_path,
-                    plain_title=memo.plain_title,
-                    folder=memo.memo_folder,
-                    uuid=memo.uuid,
-                    transcription=transcription_msg,
-                    status="skipped",
-                    date=memo.recording_date
-                ))
-                if progress_bar:
-                    progress_bar.update(1)
-                continue
+        # A consumer that stops early closes this generator; the finally still
+        # tidies the pool, closes the bar and records the batch
+        try:
+            for index, memo in enumerate(iterator):
+                while next_index in done:
+                    yield done.pop(next_index)
+                    next_index += 1
 
-            # Construct full file path
-            full_path = self.recordings_base / memo.f_path
+                # Generate output path for this memo
+                output_file_path = self._generate_output_path(memo)
 
-            # Check if already processed in database
-            if transcribe and self.db.is_file_processed(memo.uuid, str(full_path)):
-                # Load from database
-                existing_record = self.db.get_transcription(memo.uuid)
-                if existing_record:
-                    if progress_bar:
-                        progress_bar.write(f"Cached: {memo.plain_title}")
-                        progress_bar.update(1)
+                # Check duration first (convert to minutes)
+                duration_minutes = memo.duration_seconds / 60.0
+                if duration_minutes > max_duration_minutes:
+                    transcription_msg = f"Skipped: too long ({duration_minutes:.1f} min > {max_duration_minutes} min)"
 
-                    organised.append(OrganisedMemo(
-                        file_path=existing_record.file_path,
-                        plain_title=existing_record.plain_title,
-                        folder=existing_record.folder_name,
-                        uuid=existing_record.uuid,
-                        transcription=existing_record.transcription,
-                        status=existing_record.status,
-                        date=existing_record.recording_date
-                    ))
-
-                    if existing_record.status == 'success':
-                        success_count += 1
-                    elif existing_record.status == 'failed':
-                        failed_count += 1
-                    else:
-                        skipped_count += 1
-                    continue
-
-            # Check if file exists
-            if not full_path.exists():
-                # TODO: this is largely pointless skip if missing is a bit shite, remove
-                if skip_missing:
-                    transcription_msg = f"skipping: file not found, may not be synced?"
+                    # Save to database
                     if transcribe:
                         self.db.save_transcription(TranscriptionRecord(
                             uuid=memo.uuid,
@@ -222,146 +191,258 @@ class MemoOrganiser:
                         ))
                         skipped_count += 1
 
-                    organised.append(OrganisedMemo(
-                        file_path=str(full_path),
+                    done[index] = OrganisedMemo(
+                        file_path=memo.f_path,
                         plain_title=memo.plain_title,
                         folder=memo.memo_folder,
                         uuid=memo.uuid,
                         transcription=transcription_msg,
                         status="skipped",
                         date=memo.recording_date
-                    ))
+                    )
                     if progress_bar:
                         progress_bar.update(1)
                     continue
-                else:
-                    transcription_msg = f"File not found: {full_path}, may not be synced"
-                    if transcribe:
-                        self.db.save_transcription(TranscriptionRecord(
+
+                # Construct full file path
+                full_path = self.recordings_base / memo.f_path
+
+                # Check if already processed in database
+                if transcribe and self.db.is_file_processed(memo.uuid, str(full_path)):
+                    # Load from database
+                    existing_record = self.db.get_transcription(memo.uuid)
+                    if existing_record:
+                        if progress_bar:
+                            progress_bar.write(f"Cached: {memo.plain_title}")
+                            progress_bar.update(1)
+
+                        done[index] = OrganisedMemo(
+                            file_path=existing_record.file_path,
+                            plain_title=existing_record.plain_title,
+                            folder=existing_record.folder_name,
+                            uuid=existing_record.uuid,
+                            transcription=existing_record.transcription,
+                            status=existing_record.status,
+                            date=existing_record.recording_date
+                        )
+
+                        if existing_record.status == 'success':
+                            success_count += 1
+                        elif existing_record.status == 'failed':
+                            failed_count += 1
+                        else:
+                            skipped_count += 1
+                        continue
+
+                # Check if file exists
+                if not full_path.exists():
+                    # TODO: this is largely pointless skip if missing is a bit shite, remove
+                    if skip_missing:
+                        transcription_msg = f"skipping: file not found, may not be synced?"
+                        if transcribe:
+                            self.db.save_transcription(TranscriptionRecord(
+                                uuid=memo.uuid,
+                                plain_title=memo.plain_title,
+                                folder_name=memo.memo_folder,
+                                file_path=memo.f_path,
+                                output_file_path=output_file_path,
+                                transcription=transcription_msg,
+                                status="skipped",
+                                duration_seconds=memo.duration_seconds,
+                                recording_date=memo.recording_date,
+                                processed_at=datetime.now().isoformat()
+                            ))
+                            skipped_count += 1
+
+                        done[index] = OrganisedMemo(
+                            file_path=str(full_path),
+                            plain_title=memo.plain_title,
+                            folder=memo.memo_folder,
                             uuid=memo.uuid,
+                            transcription=transcription_msg,
+                            status="skipped",
+                            date=memo.recording_date
+                        )
+                        if progress_bar:
+                            progress_bar.update(1)
+                        continue
+                    else:
+                        transcription_msg = f"File not found: {full_path}, may not be synced"
+                        if transcribe:
+                            self.db.save_transcription(TranscriptionRecord(
+                                uuid=memo.uuid,
+                                plain_title=memo.plain_title,
+                                folder_name=memo.memo_folder,
+                                file_path=memo.f_path,
+                                output_file_path=output_file_path,
+                                transcription=transcription_msg,
+                                status="failed",
+                                error_message=transcription_msg,
+                                duration_seconds=memo.duration_seconds,
+                                recording_date=memo.recording_date,
+                                processed_at=datetime.now().isoformat()
+                            ))
+                            failed_count += 1
+
+                        done[index] = OrganisedMemo(
+                            file_path=str(full_path),
                             plain_title=memo.plain_title,
-                            folder_name=memo.memo_folder,
-                            file_path=memo.f_path,
-                            output_file_path=output_file_path,
+                            folder=memo.memo_folder,
+                            uuid=memo.uuid,
                             transcription=transcription_msg,
                             status="failed",
-                            error_message=transcription_msg,
-                            duration_seconds=memo.duration_seconds,
-                            recording_date=memo.recording_date,
-                            processed_at=datetime.now().isoformat()
-                        ))
-                        failed_count += 1
+                            date=memo.recording_date
+                        )
+                        if progress_bar:
+                            progress_bar.update(1)
+                        continue
 
-                    organised.append(OrganisedMemo(
-                        file_path=str(full_path),
-                        plain_title=memo.plain_title,
-                        folder=memo.memo_folder,
-                        uuid=memo.uuid,
-                        transcription=transcription_msg,
-                        status="failed",
-                        date=memo.recording_date
-                    ))
-                    if progress_bar:
-                        progress_bar.update(1)
-                    continue
+                # Get transcription if requested
+                transcription = ""
+                status = "success"
 
-            # Get transcription if requested
-            transcription = ""
-            status = "success"
+                if transcribe:
+                    processed_count += 1
 
-            if transcribe:
-                processed_count += 1
+                    if workers > 1:
+                        # Yielded once the pool finishes this memo and every earlier one
+                        future = executor.submit(self._timed_transcribe, full_path, model, workers)
+                        futures[future] = (index, memo, full_path, output_file_path)
+                        continue
 
-                # Display current file name above progress bar
-                if progress_bar:
-                    # Use tqdm.write to print above the progress bar
-                    progress_bar.write(f"Processing: {memo.plain_title}")
-                else:
-                    elapsed = time.time() - start_time
-                    if processed_count > 1:
-                        avg_time = elapsed / (processed_count - 1)
-                        remaining = avg_time * (len(memo_files) - processed_count)
-                        print(f"[{processed_count}/{len(memo_files)}] Transcribing: {memo.plain_title} "
-                              f"(~{remaining:.0f}s remaining)")
+                    # Display current file name above progress bar
+                    if progress_bar:
+                        # Use tqdm.write to print above the progress bar
+                        progress_bar.write(f"Processing: {memo.plain_title}")
                     else:
-                        print(f"[{processed_count}/{len(memo_files)}] Transcribing: {memo.plain_title}")
-
-                # Time the transcription
-                transcription_start = time.time()
-                try:
-                    transcription = transcribe_file(str(full_path), model=model)
-                    transcription_time = time.time() - transcription_start
+                        elapsed = time.time() - start_time
+                        if processed_count > 1:
+                            avg_time = elapsed / (processed_count - 1)
+                            remaining = avg_time * (len(memo_files) - processed_count)
+                            print(f"[{processed_count}/{len(memo_files)}] Transcribing: {memo.plain_title} "
+                                  f"(~{remaining:.0f}s remaining)")
+                        else:
+                            print(f"[{processed_count}/{len(memo_files)}] Transcribing: {memo.plain_title}")
+
+                    transcription, transcription_time = self._timed_transcribe(full_path, model, workers)
                     total_processing_time += transcription_time
-
-                    # Check if transcription indicates an error
-                    if transcription.startswith(("Transcription error:", "Recognition failed:", "Speech recognition not available")):
-                        status = "failed"
-                        failed_count += 1
-                    else:
-                        status = "success"
+                    status = self._save_transcribed(memo, full_path, output_file_path, model,
+                                                    transcription, transcription_time)
+                    if status == "success":
                         success_count += 1
+                    else:
+                        failed_count += 1
 
-                except Exception as e:
-                    transcription_time = time.time() - transcription_start
-                    total_processing_time += transcription_time
-                    transcription = f"Transcription error: {str(e)}"
-                    status = "failed"
-                    failed_count += 1
+                else:
+                    transcription = "[Transcription not requested]"
+                    status = "skipped"
+                    skipped_count += 1
 
-                # Save transcription to database
-                file_hash = self.db.get_file_hash(str(full_path))
-                self.db.save_transcription(TranscriptionRecord(
-                    uuid=memo.uuid,
+                # Update progress bar
+                if progress_bar:
+                    progress_bar.update(1)
+
+                done[index] = OrganisedMemo(
+                    file_path=str(full_path),
                     plain_title=memo.plain_title,
-                    folder_name=memo.memo_folder,
-                    file_path=memo.f_path,
-                    output_file_path=output_file_path,
+                    folder=memo.memo_folder,
+                    uuid=memo.uuid,
                     transcription=transcription,
                     status=status,
-                    error_message=transcription if status == "failed" else None,
-                    duration_seconds=memo.duration_seconds,
-                    recording_date=memo.recording_date,
-                    processed_at=datetime.now().isoformat(),
-                    file_hash=file_hash,
-                    model_used=model.value,
-                    processing_time_seconds=transcription_time
-                ))
+                    date=memo.recording_date
+                )
 
-            else:
-                transcription = "[Transcription not requested]"
-                status = "skipped"
-                skipped_count += 1
+            while next_index in done:
+                yield done.pop(next_index)
+                next_index += 1
 
-            # Update progress bar
-            if progress_bar:
-                progress_bar.update(1)
+            if executor is not None:
+                # Saves and progress stay on this thread, in completion order
+                for future in as_completed(futures):
+                    index, memo, full_path, output_file_path = futures[future]
+                    transcription, transcription_time = future.result()
+                    total_processing_time += transcription_time
+                    status = self._save_transcribed(memo, full_path, output_file_path, model,
+                                                    transcription, transcription_time)
+                    if status == "success":
+                        success_count += 1
+                    else:
+                        failed_count += 1
 
-            organised.append(OrganisedMemo(
-                file_path=str(full_path),
-                plain_title=memo.plain_title,
-                folder=memo.memo_folder,
-                uuid=memo.uuid,
-                transcription=transcription,
-                status=status,
-                date=memo.recording_date
-            ))
-
-        # Close progress bar
-        if progress_bar:
-            progress_bar.close()
+                    if progress_bar:
+                        progress_bar.write(f"Transcribed: {memo.plain_title}")
+                        progress_bar.update(1)
+                    else:
+                        print(f"Transcribed: {memo.plain_title} [{status}]")
 
-        # Finish batch tracking
-        if transcribe and processed_count > 0:
-            avg_processing_time = total_processing_time / processed_count if processed_count > 0 else 0.0
-            self.db.finish_processing_batch(
-                batch_id=batch_id,
-                success_count=success_count,
-                failed_count=failed_count,
-                skipped_count=skipped_count,
-                avg_time=avg_processing_time
-            )
+                    done[index] = OrganisedMemo(
+                        file_path=str(full_path),
+                        plain_title=memo.plain_title,
+                        folder=memo.memo_folder,
+                        uuid=memo.uuid,
+                        transcription=transcription,
+                        status=status,
+                        date=memo.recording_date
+                    )
+                    while next_index in done:
+                        yield done.pop(next_index)
+                        next_index += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+            # Close progress bar
+            if progress_bar:
+                progress_bar.close()
+
+            # Finish batch tracking
+            if transcribe and processed_count > 0:
+                avg_processing_time = total_processing_time / processed_count if processed_count > 0 else 0.0
+                self.db.finish_processing_batch(
+                    batch_id=batch_id,
+                    success_count=success_count,
+                    failed_count=failed_count,
+                    skipped_count=skipped_count,
+                    avg_time=avg_processing_time
+                )
+
+    @staticmethod
+    def _timed_transcribe(full_path: Path, model: TranscriptionModel, workers: int) -> Tuple[str, float]:
+        """Transcribe one file, returning (text, seconds); errors come back as text."""
+        transcription_start = time.time()
+        try:
+            transcription = transcribe_file(str(full_path), model=model, num_workers=workers)
+        except Exception as e:
+            transcription = f"Transcription error: {str(e)}"
+        return transcription, time.time() - transcription_start
+
+    def _save_transcribed(self, memo: VoiceMemoFile, full_path: Path, output_file_path: str,
+                          model: TranscriptionModel, transcription: str, transcription_time: float) -> str:
+        """Save a finished transcription to the database and return its status."""
+        # Check if transcription indicates an error
+        if transcription.startswith(("Transcription error:", "Recognition failed:", "Speech recognition not available")):
+            status = "failed"
+        else:
+            status = "success"
 
-        return organised
+        file_hash = self.db.get_or_compute_file_hash(str(full_path))
+        self.db.save_transcription(TranscriptionRecord(
+            uuid=memo.uuid,
+            plain_title=memo.plain_title,
+            folder_name=memo.memo_folder,
+            file_path=memo.f_path,
+            output_file_path=output_file_path,
+            transcription=transcription,
+            status=status,
+            error_message=transcription if status == "failed" else None,
+            duration_seconds=memo.duration_seconds,
+            recording_date=memo.recording_date,
+            processed_at=datetime.now().isoformat(),
+            file_hash=file_hash,
+            model_used=model.value,
+            processing_time_seconds=transcription_time
+        ))
+        return status
 
     def organise_and_filter(self, memo_files: List[VoiceMemoFile],
                           folder_filter: str = None,
@@ -377,22 +458,21 @@ class MemoOrganiser:
         Returns:
             Filtered list of OrganisedMemo objects
         """
-        organised = self.organise_memos(memo_files)
-
-        filtered = organised
-
+        # Filter on folder before organising so other folders are never transcribed
         if folder_filter:
-            filtered = [memo for memo in filtered if memo.folder == folder_filter]
+            memo_files = [memo for memo in memo_files if memo.memo_folder == folder_filter]
+
+        filtered = self.organise_memos(memo_files)
 
         if status_filter:
             filtered = [memo for memo in filtered if memo.status == status_filter]
 
         return filtered
 
-    def get_transcription_summary(self, organised_memos: List[OrganisedMemo]) -> Dict[str, int]:
-        """Get summary statistics for transcriptions."""
+    def get_transcription_summary(self, organised_memos: Iterable[OrganisedMemo]) -> Dict[str, int]:
+        """Get summary statistics for transcriptions, consuming organised_memos once."""
         summary = {
-            'total': len(organised_memos),
+            'total': 0,
             'success': 0,
             'failed': 0,
             'skipped': 0,
@@ -400,6 +480,7 @@ class MemoOrganiser:
         }
 
         for memo in organised_memos:
+            summary['total'] += 1
             summary[memo.status] += 1
             if memo.status == 'success':
                 summary['total_chars'] += len(memo.transcription)
@@ -468,7 +549,7 @@ class MemoOrganiser:
 
     def _format_markdown(self, record: TranscriptionRecord) -> str:
         """Format transcription as Markdown with metadata header."""
-        duration_min = (record.duration_seconds or 0) / 60.0
+        duration_min = record.duration_minutes
 
         content = f"# {record.plain_title}\n\n"
         content += f"**Folder:** {record.folder_name}"
@@ -566,6 +647,9 @@ class MemoOrganiser:
             progress_bar = None
             print(f"Exporting {len(records)} transcriptions...")
 
+        # Export rows are collected and written together after the loop,
+        # so no write transaction is held open while files are written
+        exports = []
         for record in records:
             # Build output path with correct extension
             output_path_base = Path(record.output_file_path).with_suffix('')
@@ -582,7 +666,7 @@ class MemoOrganiser:
                     print(f"Failed to format {record.plain_title}: {e}")
 
                 # Record failed export
-                self.db.record_export(ExportRecord(
+                exports.append(ExportRecord(
                     uuid=record.uuid,
                     output_file_path=str(full_output_path),
                     export_status='failed',
@@ -619,7 +703,7 @@ class MemoOrganiser:
                 else:
                     print(f"Failed to create directory for {record.plain_title}: {e}")
 
-                self.db.record_export(ExportRecord(
+                exports.append(ExportRecord(
                     uuid=record.uuid,
                     output_file_path=str(full_output_path),
                     export_status='failed',
@@ -641,7 +725,7 @@ class MemoOrganiser:
                 checksum = self._get_file_hash(full_output_path)
 
                 # Record successful export
-                self.db.record_export(ExportRecord(
+                exports.append(ExportRecord(
                     uuid=record.uuid,
                     output_file_path=str(full_output_path),
                     export_status='success',
@@ -662,7 +746,7 @@ class MemoOrganiser:
                 else:
                     print(f"Failed to write {record.plain_title}: {e}")
 
-                self.db.record_export(ExportRecord(
+                exports.append(ExportRecord(
                     uuid=record.uuid,
                     output_file_path=str(full_output_path),
                     export_status='failed',
@@ -674,6 +758,9 @@ class MemoOrganiser:
             if progress_bar:
                 progress_bar.update(1)
 
+        if exports:
+            self.db.record_exports(exports)
+
         if progress_bar:
             progress_bar.close()
 
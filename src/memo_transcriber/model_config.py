@@ -2,6 +2,7 @@
 Model configuration for transcription engines.
 """
 
+import functools
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass
@@ -22,7 +23,7 @@ class TranscriptionModel(str, Enum):
     FASTER_WHISPER_LARGE = "faster-whisper-large-v3"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
     """Information about a transcription model."""
     name: str
@@ -144,11 +145,16 @@ def get_model_info(model: TranscriptionModel) -> ModelInfo:
     return MODEL_INFO[model]
 
 
-def list_available_models() -> list[tuple[str, str]]:
-    """List all available models with their display names."""
-    return [(model.value, info.display_name) for model, info in MODEL_INFO.items()]
+@functools.lru_cache(maxsize=1)
+def list_available_models() -> tuple[tuple[str, str], ...]:
+    """List all available models with their display names.
 
+    MODEL_INFO is static, so the result is built once; a tuple keeps the cached value immutable.
+    """
+    return tuple((model.value, info.display_name) for model, info in MODEL_INFO.items())
 
+
+@functools.lru_cache(maxsize=1)
 def get_default_model() -> TranscriptionModel:
     """Get the default transcription model."""
     return TranscriptionModel.FASTER_WHISPER_BASE
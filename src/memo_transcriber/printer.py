@@ -2,9 +2,15 @@
 High-level printing functions for CLI commands.
 Uses cli_output utilities for consistent formatting.
 """
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Callable, TextIO
 from .cli_output import CliPrinter, OutputStyle
 
+try:
+    from tqdm import tqdm
+    HAS_TQDM = True
+except ImportError:
+    HAS_TQDM = False
+
 
 # Constants
 STATUS_EMOJI_MAP = {
@@ -13,6 +19,9 @@ STATUS_EMOJI_MAP = {
     'skipped': OutputStyle.SKIP
 }
 
+# Default title Voice Memos gives recordings, e.g. "New Recording 12"
+UNTITLED_PREFIX = "New Recording"
+
 
 class Printer:
     """High-level printing functions for CLI commands."""
@@ -37,14 +46,14 @@ class Printer:
         return text[:max_length] + "..."
 
     @staticmethod
-    def _print_stats_section(
+    def _format_stats_section(
         stats: Dict[str, Any],
         section_key: str,
         section_title: str,
         empty_message: str,
         detail_formatter: Optional[Callable[[Dict[str, Any]], List[tuple]]] = None
-    ) -> None:
-        """Generic function to print a statistics section.
+    ) -> List[str]:
+        """Generic function to format a statistics section.
 
         Args:
             stats: Full statistics dictionary
@@ -53,21 +62,20 @@ class Printer:
             empty_message: Message to show if section is empty
             detail_formatter: Optional function to extract additional details from data dict
         """
-        if section_key in stats and stats[section_key]:
-            CliPrinter.blank_line()
-            CliPrinter.info(section_title)
-            for status, data in stats[section_key].items():
-                count = data['count']
-                CliPrinter.kv(f"{status.capitalize()}", f"{count} files", indent_level=1)
-
-                # Print additional details if formatter provided
-                if detail_formatter:
-                    details = detail_formatter(data)
-                    for key, value in details:
-                        CliPrinter.kv(key, value, indent_level=2)
-        else:
-            CliPrinter.blank_line()
-            CliPrinter.info(empty_message)
+        if not (section_key in stats and stats[section_key]):
+            return ["", empty_message]
+
+        lines = ["", section_title]
+        for status, data in stats[section_key].items():
+            count = data['count']
+            lines.append(CliPrinter.format_kv(f"{status.capitalize()}", f"{count} files", indent_level=1))
+
+            # Add additional details if formatter provided
+            if detail_formatter:
+                details = detail_formatter(data)
+                for key, value in details:
+                    lines.append(CliPrinter.format_kv(key, value, indent_level=2))
+        return lines
 
     @staticmethod
     def _print_dict_as_kvs(data: Dict[str, Any], indent_level: int = 1) -> None:
@@ -115,51 +123,84 @@ class Printer:
     # Database Stats Functions
     # ============================================
 
+    @staticmethod
+    def _format_db_stats_header(db_path: str, emoji: str = OutputStyle.STATS) -> List[str]:
+        """Format the header section for database statistics."""
+        return [
+            CliPrinter.format_header(f"Database: {db_path}", emoji),
+            OutputStyle.SEPARATOR,
+        ]
+
     @staticmethod
     def print_db_stats_header(db_path: str, emoji: str = OutputStyle.STATS) -> None:
         """Print the header section for database statistics."""
-        CliPrinter.section_start(f"Database: {db_path}", emoji)
+        CliPrinter.write_lines(Printer._format_db_stats_header(db_path, emoji))
 
     @staticmethod
-    def print_transcription_stats(stats: Dict[str, Any]) -> None:
-        """Print transcription statistics section."""
-        def format_transcription_details(data: Dict[str, Any]) -> List[tuple]:
-            """Extract additional transcription details."""
-            details = []
-            avg_time = data.get('avg_time', 0) or 0
-            total_duration = data.get('total_duration', 0) or 0
+    def _format_transcription_details(data: Dict[str, Any]) -> List[tuple]:
+        """Extract additional transcription details."""
+        details = []
+        avg_time = data['avg_time']
+        total_duration = data['total_duration']
 
-            if avg_time > 0:
-                details.append(("Avg processing time", f"{avg_time:.2f}s"))
-            if total_duration > 0:
-                details.append(("Total audio duration", f"{total_duration/60:.1f} minutes"))
+        if avg_time > 0:
+            details.append(("Avg processing time", f"{avg_time:.2f}s"))
+        if total_duration > 0:
+            details.append(("Total audio duration", f"{total_duration/60:.1f} minutes"))
 
-            return details
+        return details
 
-        Printer._print_stats_section(
+    @staticmethod
+    def _format_transcription_stats(stats: Dict[str, Any]) -> List[str]:
+        """Format transcription statistics section."""
+        return Printer._format_stats_section(
             stats=stats,
             section_key='transcriptions',
             section_title="Transcription Summary:",
             empty_message="No transcriptions found in database",
-            detail_formatter=format_transcription_details
+            detail_formatter=Printer._format_transcription_details
         )
 
     @staticmethod
-    def print_export_stats(stats: Dict[str, Any]) -> None:
-        """Print export statistics section."""
-        Printer._print_stats_section(
+    def print_transcription_stats(stats: Dict[str, Any]) -> None:
+        """Print transcription statistics section."""
+        CliPrinter.write_lines(Printer._format_transcription_stats(stats))
+
+    @staticmethod
+    def _format_export_stats(stats: Dict[str, Any]) -> List[str]:
+        """Format export statistics section."""
+        return Printer._format_stats_section(
             stats=stats,
             section_key='exports',
             section_title="Export Summary:",
             empty_message="No exports recorded yet"
         )
 
+    @staticmethod
+    def print_export_stats(stats: Dict[str, Any]) -> None:
+        """Print export statistics section."""
+        CliPrinter.write_lines(Printer._format_export_stats(stats))
+
+    @staticmethod
+    def _format_unexported_count(count: int) -> List[str]:
+        """Format the count of unexported transcriptions."""
+        if count > 0:
+            return ["", f"Unexported transcriptions: {count} files ready for export"]
+        return []
+
     @staticmethod
     def print_unexported_count(count: int) -> None:
         """Print the count of unexported transcriptions."""
-        if count > 0:
-            CliPrinter.blank_line()
-            CliPrinter.info(f"Unexported transcriptions: {count} files ready for export")
+        CliPrinter.write_lines(Printer._format_unexported_count(count))
+
+    @staticmethod
+    def print_db_stats(db_path: str, stats: Dict[str, Any], unexported_count: int) -> None:
+        """Print the full db-stats report as a single buffered write."""
+        lines = Printer._format_db_stats_header(db_path)
+        lines.extend(Printer._format_transcription_stats(stats))
+        lines.extend(Printer._format_export_stats(stats))
+        lines.extend(Printer._format_unexported_count(unexported_count))
+        CliPrinter.write_lines(lines)
 
     # ============================================
     # List Cached Functions
@@ -173,65 +214,103 @@ class Printer:
 
     @staticmethod
     def print_list_limit_message(shown: int, total: int) -> None:
-        """Print message about limited results."""
-        CliPrinter.info(f"Showing first {shown} of {total} records (use --limit to see more)")
+        """Print message about limited results, the next page hint follows the list."""
+        CliPrinter.info(f"Showing first {shown} of {total} records")
+
+    @staticmethod
+    def print_next_page_hint(last_record: Any) -> None:
+        """Print the options that continue a list after its last record."""
+        CliPrinter.blank_line()
+        if last_record.processed_at is None:
+            # Undated records come last, the uuid alone is the cursor
+            CliPrinter.info(f"Next page: --after-uuid {last_record.uuid}")
+        else:
+            CliPrinter.info(f"Next page: --after '{last_record.processed_at}' --after-uuid {last_record.uuid}")
+
+    @staticmethod
+    def _format_cached_header(count: int) -> List[str]:
+        """Format header lines for cached transcriptions list."""
+        return [
+            CliPrinter.format_header(f"Cached Transcriptions ({count} records):"),
+            OutputStyle.SEPARATOR,
+        ]
 
     @staticmethod
     def print_cached_header(count: int) -> None:
         """Print header for cached transcriptions list."""
-        CliPrinter.header(f"Cached Transcriptions ({count} records):")
-        CliPrinter.separator()
+        CliPrinter.write_lines(Printer._format_cached_header(count))
 
     @staticmethod
-    def print_transcription_compact(record: Any) -> None:
-        """Print a single transcription record in compact format."""
+    def _format_transcription_compact(record: Any) -> List[str]:
+        """Format a single transcription record in compact format."""
         # Check if title is generic "New Recording X" pattern
-        is_untitled = record.plain_title.startswith("New Recording")
+        is_untitled = record.plain_title.startswith(UNTITLED_PREFIX)
 
         if is_untitled and record.status == 'success' and record.transcription:
-            # Show first ~5 words of transcription
-            words = record.transcription.split()[:5]
-            display_title = ' '.join(words) + ('...' if len(record.transcription.split()) > 5 else '')
+            # Show first ~5 words of transcription, maxsplit stops scanning after the 6th
+            words = record.transcription.split(None, 5)
+            display_title = ' '.join(words[:5]) + ('...' if len(words) > 5 else '')
         else:
             display_title = record.plain_title
 
         # Get status emoji
         status_emoji = STATUS_EMOJI_MAP.get(record.status, OutputStyle.UNKNOWN)
-        print(f"{status_emoji} {display_title} [{record.status}]")
+        return [f"{status_emoji} {display_title} [{record.status}]"]
 
     @staticmethod
-    def print_transcription_detailed(record: Any) -> None:
-        """Print a single transcription record in detailed format."""
-        duration_min = (record.duration_seconds or 0) / 60.0
+    def print_transcription_compact(record: Any) -> None:
+        """Print a single transcription record in compact format."""
+        CliPrinter.write_lines(Printer._format_transcription_compact(record))
+
+    @staticmethod
+    def _format_transcription_detailed(record: Any) -> List[str]:
+        """Format a single transcription record in detailed format."""
+        duration_min = record.duration_minutes
         proc_time = record.processing_time_seconds or 0
 
-        CliPrinter.blank_line()
-        CliPrinter.header(record.plain_title, OutputStyle.NOTE)
-        CliPrinter.kv("UUID", record.uuid)
-        CliPrinter.kv("Folder", record.folder_name)
-        CliPrinter.kv("Status", record.status)
-        CliPrinter.kv("Duration", f"{duration_min:.1f} min")
+        lines = [
+            "",
+            CliPrinter.format_header(record.plain_title, OutputStyle.NOTE),
+            CliPrinter.format_kv("UUID", record.uuid),
+            CliPrinter.format_kv("Folder", record.folder_name),
+            CliPrinter.format_kv("Status", record.status),
+            CliPrinter.format_kv("Duration", f"{duration_min:.1f} min"),
+        ]
 
         if proc_time > 0:
-            CliPrinter.kv("Processing time", f"{proc_time:.2f}s")
+            lines.append(CliPrinter.format_kv("Processing time", f"{proc_time:.2f}s"))
         if record.model_used:
-            CliPrinter.kv("Model", record.model_used)
+            lines.append(CliPrinter.format_kv("Model", record.model_used))
         if record.processed_at:
-            CliPrinter.kv("Processed", record.processed_at)
+            lines.append(CliPrinter.format_kv("Processed", record.processed_at))
 
         if record.status == 'success' and record.transcription:
-            CliPrinter.kv("Preview", Printer._truncate_text(record.transcription))
+            lines.append(CliPrinter.format_kv("Preview", Printer._truncate_text(record.transcription)))
         elif record.status == 'failed' and record.error_message:
-            CliPrinter.kv("Error", record.error_message)
+            lines.append(CliPrinter.format_kv("Error", record.error_message))
+
+        return lines
 
     @staticmethod
-    def print_cached_list(records: List[Any], compact: bool = False) -> None:
-        """Print a list of cached transcriptions."""
-        Printer.print_cached_header(len(records))
+    def print_transcription_detailed(record: Any) -> None:
+        """Print a single transcription record in detailed format."""
+        CliPrinter.write_lines(Printer._format_transcription_detailed(record))
 
-        print_func = Printer.print_transcription_compact if compact else Printer.print_transcription_detailed
+    @staticmethod
+    def print_cached_list(records: Iterable[Any], compact: bool = False, count: Optional[int] = None,
+                          out: Optional[TextIO] = None) -> None:
+        """Print cached transcriptions, writing each record as it arrives.
+
+        count is required when records is an iterator rather than a list.
+        Pass a StringIO as out to collect a page and write it to stdout once.
+        """
+        if count is None:
+            count = len(records)
+        CliPrinter.write_lines(Printer._format_cached_header(count), out)
+
+        format_func = Printer._format_transcription_compact if compact else Printer._format_transcription_detailed
         for record in records:
-            print_func(record)
+            CliPrinter.write_lines(format_func(record), out)
 
     # ============================================
     # List Models Functions
@@ -259,7 +338,7 @@ class Printer:
         CliPrinter.info("Usage: memo-transcriber organise --model <model-name>")
 
     @staticmethod
-    def print_invalid_model_error(model: str, available_models: List[tuple]) -> None:
+    def print_invalid_model_error(model: str, available_models: Iterable[tuple]) -> None:
         """Print error message for invalid model selection."""
         CliPrinter.error(f"Invalid model: {model}")
         CliPrinter.blank_line()
@@ -279,18 +358,46 @@ class Printer:
         CliPrinter.header(f"Model: {model}", OutputStyle.ROBOT)
 
     @staticmethod
-    def print_organised_memo(memo: Any) -> None:
-        """Print a single organised memo result."""
-        CliPrinter.header(memo.plain_title, OutputStyle.NOTE)
-        CliPrinter.kv("Status", memo.status)
-        CliPrinter.kv("Folder", memo.folder)
+    def _format_organised_memo(memo: Any) -> List[str]:
+        """Format a single organised memo result."""
+        lines = [
+            CliPrinter.format_header(memo.plain_title, OutputStyle.NOTE),
+            CliPrinter.format_kv("Status", memo.status),
+            CliPrinter.format_kv("Folder", memo.folder),
+        ]
 
         if memo.status == 'success':
-            CliPrinter.kv("Transcript", Printer._truncate_text(memo.transcription))
+            lines.append(CliPrinter.format_kv("Transcript", Printer._truncate_text(memo.transcription)))
         elif memo.status == 'failed':
-            CliPrinter.kv("Error", memo.transcription)
+            lines.append(CliPrinter.format_kv("Error", memo.transcription))
 
-        CliPrinter.blank_line()
+        lines.append("")
+        return lines
+
+    @staticmethod
+    def print_organised_memo(memo: Any) -> None:
+        """Print a single organised memo result."""
+        CliPrinter.write_lines(Printer._format_organised_memo(memo))
+
+    @staticmethod
+    def print_organised_memos_as_done(memos: Iterable[Any]) -> Iterator[Any]:
+        """Print each organised memo as it arrives, passing it on to the caller.
+
+        Lines go through tqdm.write when tqdm is installed so they land above
+        the organiser's progress bar rather than through it. Closing this
+        generator closes memos too.
+        """
+        try:
+            for memo in memos:
+                if HAS_TQDM:
+                    tqdm.write("\n".join(Printer._format_organised_memo(memo)))
+                else:
+                    Printer.print_organised_memo(memo)
+                yield memo
+        finally:
+            close = getattr(memos, 'close', None)
+            if close is not None:
+                close()
 
     @staticmethod
     def print_organise_summary(summary: Dict[str, int]) -> None:
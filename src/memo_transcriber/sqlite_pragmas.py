@@ -0,0 +1,20 @@
+"""
+Per-connection SQLite tuning shared by the transcription and Voice Memos databases.
+"""
+import sqlite3
+
+# All per-connection, nothing is written to the db file; journal_mode=WAL is
+# persistent and set once in MemoDatabase.init_database instead
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+
+def apply_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply CONNECTION_PRAGMAS to conn and return it."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
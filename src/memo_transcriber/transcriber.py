@@ -51,13 +51,15 @@ def transcribe_file_apple_speech(file_path: str) -> str:
         return f"Transcription error: {str(e)}"
 
 
-def transcribe_file(file_path: str, model: TranscriptionModel = TranscriptionModel.APPLE_SPEECH) -> str:
+def transcribe_file(file_path: str, model: TranscriptionModel = TranscriptionModel.APPLE_SPEECH,
+                    num_workers: int = 1) -> str:
     """
     Transcribe an audio file using the specified model.
 
     Args:
         file_path: Path to the audio file
         model: Transcription model to use
+        num_workers: Concurrent transcriptions the faster-whisper model should allow
 
     Returns:
         Transcribed text or error message
@@ -73,7 +75,7 @@ def transcribe_file(file_path: str, model: TranscriptionModel = TranscriptionMod
 
     elif model_info.engine == "faster-whisper":
         from .faster_whisper_transcriber import transcribe_file_faster_whisper
-        return transcribe_file_faster_whisper(file_path, model_info.model_size or "base")
+        return transcribe_file_faster_whisper(file_path, model_info.model_size or "base", num_workers)
 
     else:
         return f"Unknown transcription engine: {model_info.engine}"
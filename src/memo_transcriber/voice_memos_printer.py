@@ -2,30 +2,40 @@
 VoiceMemosPrinter - Helper class for printing Voice Memos database data in a formatted way.
 """
 
-from typing import Dict, List
-from .memo_data import analyze_folder_usage, get_unassigned_recordings, list_unassigned_recording_details
+import sys
+from typing import Dict, List, Optional, TextIO
+from .memo_data import analyze_folder_usage, get_orphaned_folder_usage, get_unassigned_recordings, has_folder_index, list_unassigned_recording_details
 from .memo_data import VoiceMemoFile, VoiceMemoFolder, UnassignedRecordings
+from .cli_output import OutputStyle
 
 class VoiceMemosPrinter:
     """Helper class for printing Voice Memos database data in a formatted way."""
 
     @staticmethod
-    def print_memo_files(memo_files: List['VoiceMemoFile']) -> None:
-        """Print all voice memo files with their details."""
+    def print_memo_files(memo_files: List['VoiceMemoFile'], out: Optional[TextIO] = None) -> None:
+        """Print all voice memo files with their details.
+
+        The listing is built up and written to out (default stdout) in one call.
+        """
+        out = out or sys.stdout
         if not memo_files:
-            print("📁 No memo files found.")
+            out.write("📁 No memo files found.\n")
             return
 
-        print(f"🎙️  Found {len(memo_files)} voice memo files:")
-        print("=" * 70)
-        print()
+        lines = [
+            f"🎙️  Found {len(memo_files)} voice memo files:",
+            OutputStyle.SEPARATOR,
+            "",
+        ]
 
         for i, memo in enumerate(memo_files, 1):
-            print(f"[{i:3d}] 🎵 {memo.plain_title}")
-            print(f"      📁 Folder: {memo.memo_folder}")
-            print(f"      🆔 UUID: {memo.uuid}")
-            print(f"      📄 Path: {memo.f_path}")
-            print("-" * 70)
+            lines.append(f"[{i:3d}] 🎵 {memo.plain_title}")
+            lines.append(f"      📁 Folder: {memo.memo_folder}")
+            lines.append(f"      🆔 UUID: {memo.uuid}")
+            lines.append(f"      📄 Path: {memo.f_path}")
+            lines.append(OutputStyle.THIN_SEPARATOR)
+
+        out.write("\n".join(lines) + "\n")
 
     @staticmethod
     def print_folders(folders: Dict[int, 'VoiceMemoFolder']) -> None:
@@ -60,55 +70,63 @@ class VoiceMemosPrinter:
         folders, usage = analyze_folder_usage(db_path)
         unassigned = get_unassigned_recordings(usage)
 
-        print("=== FOLDER STRUCTURE ANALYSIS ===")
-        print(f"Total folders found: {len(folders)}")
-        print(f"Total folder assignments tracked: {len(usage)}")
-        print()
+        # Collected and written once rather than print() per line
+        lines = [
+            "=== FOLDER STRUCTURE ANALYSIS ===",
+            f"Total folders found: {len(folders)}",
+            f"Total folder assignments tracked: {len(usage)}",
+            "",
+        ]
 
         # Print assigned folders
-        print("--- ASSIGNED FOLDERS ---")
+        lines.append("--- ASSIGNED FOLDERS ---")
         assigned_recordings = 0
         for folder_id, folder in folders.items():
             actual_count = usage.get(folder_id, 0)
             stored_count = folder.recording_count
             status = "✓" if actual_count == stored_count else "⚠️"
 
-            print(f"{status} {folder}")
-            print(f"    Stored count: {stored_count}, Actual count: {actual_count}")
-            print(f"    UUID: {folder.uuid}")
+            lines.append(f"{status} {folder}")
+            lines.append(f"    Stored count: {stored_count}, Actual count: {actual_count}")
+            lines.append(f"    UUID: {folder.uuid}")
             if actual_count != stored_count:
-                print("    ⚠️  Count mismatch - database may need maintenance")
-            print()
+                lines.append("    ⚠️  Count mismatch - database may need maintenance")
+            lines.append("")
 
             assigned_recordings += actual_count
 
         # Print unassigned recordings
-        print("--- UNASSIGNED RECORDINGS ---")
+        lines.append("--- UNASSIGNED RECORDINGS ---")
         total_unassigned = 0
         if unassigned:
             for unassigned_group in unassigned:
-                print(f"📁 {unassigned_group}")
+                lines.append(f"📁 {unassigned_group}")
                 total_unassigned += unassigned_group.count
         else:
-            print("✓ No unassigned recordings found")
+            lines.append("✓ No unassigned recordings found")
 
-        print()
-        print("--- SUMMARY ---")
+        lines.append("")
+        lines.append("--- SUMMARY ---")
         total_recordings = assigned_recordings + total_unassigned
-        print(f"Total recordings: {total_recordings}")
-        print(f"  - In folders: {assigned_recordings}")
-        print(f"  - Unassigned: {total_unassigned}")
+        lines.append(f"Total recordings: {total_recordings}")
+        lines.append(f"  - In folders: {assigned_recordings}")
+        lines.append(f"  - Unassigned: {total_unassigned}")
 
         if total_unassigned > 0:
-            print(f"  - Unassigned percentage: {(total_unassigned/total_recordings)*100:.1f}%")
-
-        # Check for any folder IDs in usage that aren't in folders table
-        orphaned_folder_ids = set(usage.keys()) - set(folders.keys()) - {None, 0}
-        if orphaned_folder_ids:
-            print(f"\n⚠️  Found recordings assigned to non-existent folder IDs: {orphaned_folder_ids}")
-            for orphaned_id in orphaned_folder_ids:
-                if orphaned_id is not None and orphaned_id > 0:
-                    print(f"    Folder ID {orphaned_id}: {usage[orphaned_id]} recordings")
+            lines.append(f"  - Unassigned percentage: {(total_unassigned/total_recordings)*100:.1f}%")
+
+        # Check for any folder IDs in recordings that aren't in folders table
+        orphaned = get_orphaned_folder_usage(db_path)
+        if orphaned:
+            orphaned_ids = ', '.join(str(folder_id) for folder_id, _ in orphaned)
+            lines.append(f"\n⚠️  Found recordings assigned to non-existent folder IDs: {orphaned_ids}")
+            for orphaned_id, count in orphaned:
+                lines.append(f"    Folder ID {orphaned_id}: {count} recordings")
+
+        if not has_folder_index(db_path):
+            lines.append("\n⚠️  No index on ZCLOUDRECORDING.ZFOLDER - folder counts scan every recording")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def example_usage_patterns(db_path: str) -> None:
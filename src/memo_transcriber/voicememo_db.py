@@ -6,10 +6,22 @@ Searches for a voicememo db in the ususal location, this is noteworthy:
 """
 import sqlite3
 import os
+import sys
+import atexit
+import functools
+from contextlib import closing, contextmanager
 from pathlib import Path
+from queue import Empty, LifoQueue
+from typing import Optional
 
+from .sqlite_pragmas import apply_pragmas
+
+@functools.lru_cache(maxsize=1)
 def _check_db_access():
-    """Check if we can access the Voice Memos database"""
+    """Check if we can access the Voice Memos database
+
+    The probe runs once per process, get_db_path and cli_get_db_path share the result.
+    """
     containers = "Library/Group Containers"
     voice_memo_base = "group.com.apple.VoiceMemos.shared/Recordings"
     db_file = "CloudRecordings.db"
@@ -34,6 +46,44 @@ def _check_db_access():
         print(f"❌ Cannot open database: {e}")
         return False, f"❌ Cannot open database: {e}"
 
+def connect(db_path):
+    """Open a tuned read-only connection to the Voice Memos database.
+
+    Uses a `mode=ro` URI so we never write to Apple's db.
+    """
+    # check_same_thread is off so pooled connections can be handed between threads
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                           cached_statements=256, isolation_level=None)
+    return apply_pragmas(conn)
+
+# Idle read-only connections keyed by db path, reused across calls
+_POOL: dict[str, LifoQueue] = {}
+
+@contextmanager
+def pooled(db_path):
+    """Borrow a warm read-only connection for db_path, returning it to the pool after."""
+    q = _POOL.setdefault(str(db_path), LifoQueue())
+    try:
+        conn = q.get_nowait()
+    except Empty:
+        conn = connect(db_path)
+    try:
+        yield conn
+    finally:
+        q.put(conn)
+
+@atexit.register
+def _close_pool():
+    """Close every pooled connection on interpreter exit."""
+    for q in _POOL.values():
+        while True:
+            try:
+                q.get_nowait().close()
+            except Empty:
+                break
+    _POOL.clear()
+
 def get_db_path():
     fp = _check_db_access()
     return fp[1]
@@ -42,7 +92,21 @@ def cli_get_db_path():
     fp = _check_db_access()
     return fp
 
+@functools.lru_cache(maxsize=1)
+def resolve_db_path() -> str:
+    """Voice Memos database path for the CLIs, exiting if it can't be opened
+
+    Cached once found; the failure path exits, so it is never cached.
+    """
+    db_path = cli_get_db_path()
+    if not db_path[0]:
+        print(f"{db_path[1]}")
+        sys.exit(1)
+    return str(db_path[1])
+
+@functools.lru_cache(maxsize=1)
 def cli_get_rec_path():
+    """Recordings directory under the Voice Memos group container, fixed per process"""
     containers = "Library/Group Containers"
     voice_memo_base = "group.com.apple.VoiceMemos.shared/Recordings"
     rc_path = Path.home() / containers / voice_memo_base 
@@ -52,89 +116,114 @@ def get_schema():
     """Find out what tables and columns exist"""
     db_path = get_db_path()
     
-    with sqlite3.connect(str(db_path)) as conn:
-        # Get all tables
-        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    # Read-only and closed on exit; `with conn` alone would only end the transaction
+    with closing(connect(db_path)) as conn:
+        # Get all tables, kept as a list since both loops below walk them
+        tables = [name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
         print("Tables found:")
-        for table in tables:
-            print(f"  - {table[0]}")
+        for table_name in tables:
+            print(f"  - {table_name}")
         
-        # Get column info for each table
-        for table in tables:
-            table_name = table[0]
+        # Get column info for each table, streamed off the cursor
+        for table_name in tables:
             print(f"\nColumns in {table_name}:")
-            columns = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
-            for col in columns:
+            for col in conn.execute(f"PRAGMA table_info({table_name})"):
                 print(f"  - {col[1]} ({col[2]})")
 
-def get_memos_with_folders(db_path: str):
+_MEMOS_QUERY_TEMPLATE = """
+SELECT 
+    r.ZUNIQUEID as recording_id,
+    r.ZCUSTOMLABEL as recording_date,
+    r.ZENCRYPTEDTITLE as plain_title, 
+    r.ZPATH as file_path,
+    r.ZDURATION as duration_seconds,
+    r.ZDATE as date_timestamp,
+    r.ZFOLDER as folder_id,
+    f.ZENCRYPTEDNAME as folder_name,
+    f.ZUUID as folder_uuid,
+    CASE 
+        WHEN f.ZENCRYPTEDNAME IS NULL THEN 'Unassigned'
+        ELSE f.ZENCRYPTEDNAME 
+    END as display_folder_name
+FROM ZCLOUDRECORDING r
+LEFT JOIN ZFOLDER f ON r.ZFOLDER = f.Z_PK
+WHERE r.ZPATH IS NOT NULL
+{folder_filter}ORDER BY r.ZDATE DESC
+"""
+
+_MEMOS_WITH_FOLDERS_QUERY = _MEMOS_QUERY_TEMPLATE.format(folder_filter="")
+# Matches on the name _memo_row_to_dict reports, so 'Unassigned' selects
+# recordings with no folder or with an empty folder name
+_MEMOS_IN_FOLDER_QUERY = _MEMOS_QUERY_TEMPLATE.format(
+    folder_filter="  AND COALESCE(NULLIF(f.ZENCRYPTEDNAME, ''), 'Unassigned') = ?\n")
+
+# A single recording by its unique id, for commands that work on one memo
+_MEMO_BY_UUID_QUERY = _MEMOS_QUERY_TEMPLATE.format(
+    folder_filter="  AND r.ZUNIQUEID = ?\n") + "LIMIT 1\n"
+
+def _memo_row_to_dict(row):
+    """Map a _MEMOS_QUERY_TEMPLATE row to the recording dict callers expect."""
+    (recording_id, recording_date, plain_title, file_path, duration_seconds,
+     date_timestamp, folder_id, folder_name, folder_uuid, _) = row
+    return {
+        'recording_id': recording_id,
+        'plain_title': plain_title or 'Untitled',
+        'file_path': file_path,
+        'duration_seconds': duration_seconds,
+        'date_timestamp': date_timestamp,
+        'recording_date': recording_date,
+        'folder_id': folder_id,
+        'folder_name': folder_name or 'Unassigned',
+        'folder_uuid': folder_uuid
+    }
+
+def get_memos_with_folders(db_path: str, folder: Optional[str] = None):
     """Get voice memo filename paths and folders from the metadata db_path
+
+    If folder is given only recordings in that folder are returned.
     """
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    
-    query = """
-    SELECT 
-        r.ZUNIQUEID as recording_id,
-        r.ZCUSTOMLABEL as recording_date,
-        r.ZENCRYPTEDTITLE as plain_title, 
-        r.ZPATH as file_path,
-        r.ZDURATION as duration_seconds,
-        r.ZDATE as date_timestamp,
-        r.ZFOLDER as folder_id,
-        f.ZENCRYPTEDNAME as folder_name,
-        f.ZUUID as folder_uuid,
-        CASE 
-            WHEN f.ZENCRYPTEDNAME IS NULL THEN 'Unassigned'
-            ELSE f.ZENCRYPTEDNAME 
-        END as display_folder_name
-    FROM ZCLOUDRECORDING r
-    LEFT JOIN ZFOLDER f ON r.ZFOLDER = f.Z_PK
-    WHERE r.ZPATH IS NOT NULL
-    ORDER BY r.ZDATE DESC
-    """
-    
-    cursor = conn.cursor()
-    cursor.execute(query)
-    
-    recordings = []
-    for row in cursor.fetchall():
-        recordings.append({
-            'recording_id': row['recording_id'],
-            'plain_title': row['plain_title'] or 'Untitled',
-            'file_path': row['file_path'],
-            'duration_seconds': row['duration_seconds'],
-            'date_timestamp': row['date_timestamp'],
-            'recording_date': row['recording_date'],
-            'folder_id': row['folder_id'],
-            'folder_name': row['folder_name'] or 'Unassigned',
-            'folder_uuid': row['folder_uuid']
-        })
+    with pooled(db_path) as conn:
+        if folder is None:
+            cursor = conn.execute(_MEMOS_WITH_FOLDERS_QUERY)
+        else:
+            cursor = conn.execute(_MEMOS_IN_FOLDER_QUERY, (folder,))
+        
+        recordings = [_memo_row_to_dict(row) for row in cursor]
     
-    conn.close()
     return recordings
 
+def get_memo_with_folder(db_path: str, recording_id: str):
+    """Get a single recording by ZUNIQUEID, or None if there isn't one
+
+    Same shape as the get_memos_with_folders entries.
+    """
+    with pooled(db_path) as conn:
+        row = conn.execute(_MEMO_BY_UUID_QUERY, (recording_id,)).fetchone()
+    return None if row is None else _memo_row_to_dict(row)
+
+_MEMO_FILES_QUERY = """
+SELECT 
+    ZUNIQUEID,
+    ZCUSTOMLABEL,
+    ZENCRYPTEDTITLE, 
+    ZPATH,
+    ZDURATION,
+    ZDATE,
+    ZFOLDER
+FROM ZCLOUDRECORDING 
+WHERE ZPATH IS NOT NULL
+ORDER BY ZDATE DESC
+"""
+
 def get_memo_files():
     """Get voice memo file paths and metadata from database"""
     db_path = get_db_path()
     
-    with sqlite3.connect(str(db_path)) as conn:
-        cursor = conn.execute("""
-            SELECT 
-                ZUNIQUEID,
-                ZCUSTOMLABEL,
-                ZENCRYPTEDTITLE, 
-                ZPATH,
-                ZDURATION,
-                ZDATE,
-                ZFOLDER,
-            FROM ZCLOUDRECORDING 
-            WHERE ZPATH IS NOT NULL
-            ORDER BY ZDATE DESC
-        """)
+    with pooled(db_path) as conn:
+        cursor = conn.execute(_MEMO_FILES_QUERY)
         
         recordings = []
-        for row in cursor.fetchall():
+        for row in cursor:
             recording = {
                 'unique_id': row[0],
                 'custom_label': row[1], # this seems to map to a date stamp
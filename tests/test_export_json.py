@@ -0,0 +1,31 @@
+"""JSON export of records with and without timings."""
+import json
+
+from memo_transcriber.database import MemoDatabase, TranscriptionRecord
+from memo_transcriber.memo_organiser import MemoOrganiser
+
+
+def test_json_export_keeps_missing_timings_null(tmp_path):
+    db_path = str(tmp_path / "memos.db")
+    db = MemoDatabase(db_path)
+    db.save_transcription(TranscriptionRecord(
+        uuid="untimed", plain_title="Untimed", folder_name="F",
+        file_path="untimed.m4a", output_file_path="F/untimed.txt",
+        transcription="text", status="success",
+    ))
+    db.save_transcription(TranscriptionRecord(
+        uuid="timed", plain_title="Timed", folder_name="F",
+        file_path="timed.m4a", output_file_path="F/timed.txt",
+        transcription="text", status="success",
+        duration_seconds=90.0, processing_time_seconds=1.5,
+    ))
+
+    organiser = MemoOrganiser(str(tmp_path), output=str(tmp_path / "out"), db_path=db_path)
+    organiser.export_transcriptions(format="json")
+
+    untimed = json.loads((tmp_path / "out" / "F" / "untimed.json").read_text())
+    timed = json.loads((tmp_path / "out" / "F" / "timed.json").read_text())
+    assert untimed["duration_seconds"] is None
+    assert untimed["processing_time_seconds"] is None
+    assert timed["duration_seconds"] == 90.0
+    assert timed["processing_time_seconds"] == 1.5
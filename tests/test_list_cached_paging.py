@@ -0,0 +1,43 @@
+"""Keyset paging through list-cached, including records with no processed_at."""
+import re
+
+from click.testing import CliRunner
+
+from memo_transcriber.cli import main
+from memo_transcriber.database import MemoDatabase, TranscriptionRecord
+
+
+def _next_page_args(output):
+    """Turn the 'Next page:' hint into list-cached arguments, None on the last page."""
+    match = re.search(r"Next page: (.*)", output)
+    if not match:
+        return None
+    return [arg.strip("'") for arg in re.findall(r"'[^']*'|\S+", match.group(1))]
+
+
+def test_paging_reaches_undated_records(tmp_path):
+    db_path = str(tmp_path / "memos.db")
+    db = MemoDatabase(db_path)
+    # Two dated records, then three saved with an explicit NULL processed_at
+    for i in range(5):
+        db.save_transcription(TranscriptionRecord(
+            uuid=f"u{i}", plain_title=f"Memo {i}", folder_name="F",
+            file_path=f"{i}.m4a", output_file_path=f"F/{i}.txt",
+            transcription="text", status="success",
+            processed_at=f"2024-01-0{i + 1}" if i < 2 else None,
+        ))
+
+    runner = CliRunner()
+    seen, args, pages = [], [], []
+    while args is not None:
+        result = runner.invoke(main, ["list-cached", "--db-path", db_path,
+                                      "--compact", "--limit", "2", *args])
+        assert result.exit_code == 0
+        assert "No transcriptions found" not in result.output
+        pages.append(result.output)
+        seen.extend(re.findall(r"Memo \d", result.output))
+        args = _next_page_args(result.output)
+
+    assert seen == ["Memo 1", "Memo 0", "Memo 4", "Memo 3", "Memo 2"]
+    assert "Showing first 2 of 5 records" in pages[0]
+    assert "--after 'None'" not in "".join(pages)
@@ -0,0 +1,46 @@
+"""Pooled organise runs yield memos in the same order as sequential ones."""
+import shutil
+import time
+from pathlib import Path
+
+import memo_transcriber.memo_organiser as memo_organiser
+from memo_transcriber.memo_data import VoiceMemoFile
+from memo_transcriber.memo_organiser import MemoOrganiser
+from memo_transcriber.model_config import TranscriptionModel
+
+
+def _fake_transcribe(path, model=None, num_workers=1):
+    # Earlier files take longer, so the pool finishes them out of order
+    index = int(Path(path).stem[1:])
+    time.sleep((8 - index) * 0.01)
+    return f"text of {Path(path).name}"
+
+
+def test_pooled_order_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setattr(memo_organiser, "transcribe_file", _fake_transcribe)
+    recordings = tmp_path / "recordings"
+    (recordings / "F").mkdir(parents=True)
+    memos = []
+    for i in range(8):
+        f_path = f"F/m{i}.m4a"
+        (recordings / f_path).write_bytes(bytes([i]))
+        # Memo 6 is skipped for length, the others are transcribed or cached
+        memos.append(VoiceMemoFile(f"u{i}", f"Memo {i}", f_path, "F",
+                                   600 if i == 6 else 30, "2024-01-01"))
+    model = TranscriptionModel.FASTER_WHISPER_BASE
+
+    # Cache a couple of memos first so the full runs mix cached and pooled ones
+    cached_db = tmp_path / "cached.db"
+    MemoOrganiser(str(recordings), db_path=str(cached_db)).organise_memos(
+        [memos[1], memos[4]], model=model)
+
+    orders = {}
+    for workers in (1, 4):
+        db_path = tmp_path / f"workers{workers}.db"
+        shutil.copy(cached_db, db_path)
+        organiser = MemoOrganiser(str(recordings), db_path=str(db_path))
+        results = organiser.organise_memos(memos, model=model, workers=workers)
+        orders[workers] = [(memo.uuid, memo.status) for memo in results]
+
+    assert orders[4] == orders[1]
+    assert [uuid for uuid, _ in orders[4]] == [memo.uuid for memo in memos]
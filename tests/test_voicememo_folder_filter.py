@@ -0,0 +1,36 @@
+"""Folder filtering in SQL agrees with the folder names reported per recording."""
+import sqlite3
+
+from memo_transcriber.voicememo_db import get_memos_with_folders
+
+
+def _make_voice_memos_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE ZFOLDER (Z_PK INTEGER PRIMARY KEY, ZENCRYPTEDNAME TEXT, ZUUID TEXT);
+        CREATE TABLE ZCLOUDRECORDING (
+            ZUNIQUEID TEXT, ZCUSTOMLABEL TEXT, ZENCRYPTEDTITLE TEXT, ZPATH TEXT,
+            ZDURATION REAL, ZDATE REAL, ZFOLDER INTEGER
+        );
+        INSERT INTO ZFOLDER VALUES (1, 'Ideas', 'f1'), (2, '', 'f2');
+        INSERT INTO ZCLOUDRECORDING VALUES
+            ('named', '2024-01-01', 'Named', 'named.m4a', 30, 3, 1),
+            ('empty', '2024-01-02', 'Empty name', 'empty.m4a', 30, 2, 2),
+            ('none', '2024-01-03', 'No folder', 'none.m4a', 30, 1, NULL);
+    """)
+    conn.commit()
+    conn.close()
+
+
+def test_unassigned_filter_includes_empty_folder_names(tmp_path):
+    db_path = str(tmp_path / "CloudRecordings.db")
+    _make_voice_memos_db(db_path)
+
+    everything = get_memos_with_folders(db_path)
+    for folder in ("Ideas", "Unassigned", ""):
+        expected = [r['recording_id'] for r in everything if r['folder_name'] == folder]
+        filtered = [r['recording_id'] for r in get_memos_with_folders(db_path, folder=folder)]
+        assert filtered == expected
+
+    unassigned = get_memos_with_folders(db_path, folder="Unassigned")
+    assert [r['recording_id'] for r in unassigned] == ["empty", "none"]